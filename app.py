@@ -1,98 +1,204 @@
 import argparse
 from enum import Enum
 from pathlib import Path
-from subprocess import run, PIPE, call
+from subprocess import call
 import json
 import tempfile
 import os
 import sys
 import ast
 import re
-import curses
-from lib.interactive import UI
-from gupy.view import ListViewDataSource
-from importlib import import_module
+from lib import groupedjson, keyscope, typescript
+from lib.cache import CatalogCache
+from lib.parallel import runPerLocale, defaultJobs
+from lib.changeset import ChangeSet
+from lib.store import TranslationStore
+from lib.searchindex import SearchIndex
+from lib import bundles
+from lib.suggestions import SuggestionCache
+from lib.duplicates import DuplicateFinder, NORMALIZATIONS
+from lib.keytrie import KeyTrie, KeyTree
+from lib.coverage import Coverage, CoverageFilter, REFERENCE_LOCALE
+from lib.searchworker import SearchWorker
+from lib.daemon import DaemonClient, TranslationDaemon
+from lib.importer import readImportRecords, ImportFileError
+from lib.usage import UsageCache, UsageReport, findSourceFiles, fileSignature as sourceFileSignature, scanSourceFiles
+from lib.timings import Timings, Profiler, FORMATS as TIMINGS_FORMATS, TIMINGS_VARIABLE, formatFromEnvironment
+from xml.etree.ElementTree import ParseError
+import csv
+from bisect import bisect_left
+from lib.localefiles import checkGroupedJsonFile, readJsonFile, readJsonFileIfChanged, saveGroupedJsonFile, writeFileAtomically
 
 BLOCK_LEVEL = 2
 TRANSLATIONS_SUBDIRECTORY = 'src/assets/i18n'
 TRANSLATIONS_PATTERN_TS   = '*.properties.ts'
 TRANSLATIONS_PATTERN_JSON = '*.json'
+SCAN_CHUNKS_PER_JOB = 4
+DUPLICATES_LIMIT = 50
+EDITOR_KEY_LINE = re.compile(r'^# (.*)$', re.MULTILINE)
+EDITOR_COMMENT_LINE = re.compile(r'^//.*\n?', re.MULTILINE)
+EDITOR_COMMENT = '// '
+SUGGESTION_COUNT = 3
 
 class Diff(Enum):
     ADDED = 1
     UPDATED = 2
     DELETED = 3
 
-class App(ListViewDataSource):
+class App:
 
     def findNthOccurrence(self, string, substring, n):
-        parts= string.split(substring, n)
-        if len(parts)<=n:
-            return -1
-        return len(string)-len(parts[-1])-len(substring)
-
+        return typescript.findNthOccurrence(string, substring, n)
 
     def findNthOccurrenceFromBehind(self, string, substring, n):
-        end = len(string)
-
-        while n > 0:
-            index = string.rfind(substring, 0, end)
-            n = n-1
-            end = index
-            if index == -1:
-                break
+        return typescript.findNthOccurrenceFromBehind(string, substring, n)
 
-        return index
+    def findLocaleFiles(self, translationsDirectory, languagTag=lambda filename: filename.split('.')[0]):
+        with self.timings.phase('discover'):
+            return {languagTag(f.name): f for f in sorted(Path(translationsDirectory).rglob(self.translationsPattern))}
 
     def readTranslationsFromTypeScript(self, translationsDirectory, languagTag=lambda filename: filename.split('.')[0], blockLevel=BLOCK_LEVEL):
-        files = { languagTag(f.name): f for f in Path(translationsDirectory).rglob(self.translationsPattern) }
-        languages = list(files.keys())
+        files = self.findLocaleFiles(translationsDirectory, languagTag)
 
-        result = {}
+        arguments = {language: (file, blockLevel) for language, file in files.items()}
+        with self.timings.phase('read'):
+            parsed, errors = runPerLocale(typescript.readTypeScriptTranslations, arguments, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'read')
 
-        for language in languages:
-            file = open(files[language], 'r')
-            content = file.read()
-            file.close()
+        nodeWorker = None
+        result = {}
+        with self.timings.phase('evaluate'):
+            for language in files.keys():
+                functionContent, translationJson = parsed[language]
 
-            begin = self.findNthOccurrence(content, '{', blockLevel)
-            end = self.findNthOccurrenceFromBehind(content, '}', blockLevel) + 1;
+                if translationJson is None:
+                    if nodeWorker is None:
+                        if not typescript.NodeWorker.isAvailable():
+                            self.reportLocaleErrors({language: 'Unsupported syntax and node is not available'}, files, 'parse')
+                        nodeWorker = typescript.NodeWorker()
 
-            functionContent = content[begin:end]
-            functionContent = 'getJson = function() {}; console.log(JSON.stringify(getJson()));'.format(functionContent)
+                    try:
+                        translationJson = nodeWorker.evaluate(functionContent)
+                    except RuntimeError as e:
+                        nodeWorker.close()
+                        self.reportLocaleErrors({language: e}, files, 'parse')
 
-            p = run(['node'], stdout=PIPE, input=functionContent.encode('utf-8'))
-            jsonString = p.stdout.decode('utf-8')
-            translationJson = json.loads(jsonString)
+                result[language] = (files[language], translationJson)
 
-            result[language] = (files[language], translationJson)
+            if nodeWorker is not None:
+                nodeWorker.close()
 
         return result
 
     def readTranslationsFromJson(self, translationsDirectory, languagTag=lambda filename: filename.split('.')[0]):
-        files = {languagTag(f.name): f for f in Path(translationsDirectory).rglob(self.translationsPattern)}
-        languages = list(files.keys())
-        result = {}
-
-        for language in languages:
-            file = open(files[language], 'r')
-            jsonString = file.read()
-            file.close()
-            translationJson = json.loads(jsonString)
-            result[language] = (files[language], translationJson)
-
-        return result
-
-    def buildTranslationsDictionary(self, translations):
-        result = {}
-        for locale, (_, jsonObject) in translations.items():
-            for key in jsonObject.keys():
-                if key in result:
-                    result[key][locale] = jsonObject[key]
-                else:
-                    result[key] = { locale: jsonObject[key] }
-
-        return result
+        files = self.findLocaleFiles(translationsDirectory, languagTag)
+
+        with self.timings.phase('read'):
+            jsonObjects, errors = runPerLocale(readJsonFile, {language: (file, self.streaming) for language, file in files.items()}, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'read')
+
+        return {language: (files[language], jsonObjects[language]) for language in files.keys()}
+
+    def reportLocaleErrors(self, errors, files, action):
+        if len(errors) == 0:
+            return
+
+        for language, error in errors.items():
+            print('Could not {} translations for locale \'{}\' in \'{}\': {}'.format(action, language, files[language], error), file=sys.stderr)
+        exit(-4)
+
+    def fileSignature(self, file):
+        stat = file.stat()
+        return (str(file), stat.st_mtime_ns, stat.st_size)
+
+    def readTranslationsCached(self, translationsDirectory, languagTag=lambda filename: filename.split('.')[0]):
+        catalogCache = CatalogCache(translationsDirectory)
+        with self.timings.phase('cache load'):
+            state = catalogCache.load()
+        if state is None:
+            state = {'files': {}, 'store': TranslationStore.fromLocaleObjects({})}
+
+        cachedFiles = state['files']
+        store = state['store']
+
+        files = self.findLocaleFiles(translationsDirectory, languagTag)
+        removedLanguages = [language for language in store.locales if language not in files]
+        stale = len(removedLanguages) > 0
+
+        resultFiles = {}
+        toRead = {}
+        for language, file in files.items():
+            signature = self.fileSignature(file)
+            cached = cachedFiles.get(language)
+            resultFiles[language] = signature
+
+            if cached is not None and cached[:3] == signature and language in store.localeIds:
+                resultFiles[language] = cached
+                continue
+
+            knownDigest = cached[3] if cached is not None and cached[0] == signature[0] and language in store.localeIds else None
+            toRead[language] = (file, knownDigest, self.streaming)
+            stale = True
+
+        with self.timings.phase('read'):
+            readResults, errors = runPerLocale(readJsonFileIfChanged, toRead, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'read')
+
+        replacedLanguages = {}
+        for language in toRead.keys():
+            digest, jsonObject = readResults[language]
+            resultFiles[language] = resultFiles[language] + (digest,)
+
+            if jsonObject is not None:
+                replacedLanguages[language] = (files[language], jsonObject)
+
+        if not stale:
+            return store
+
+        if len(replacedLanguages) > 0 or len(removedLanguages) > 0:
+            with self.timings.phase('store'):
+                store = store.withLocales(replacedLanguages, removedLanguages)
+        store.paths = {language: files[language] for language in store.locales}
+
+        with self.timings.phase('cache save'):
+            catalogCache.save(resultFiles, store)
+        return store
+
+    def loadCatalog(self, useCache=True):
+        if useCache:
+            self.useStore(self.readTranslationsCached(self.translationsDirectory))
+        else:
+            translations = self.readTranslationsFromJson(self.translationsDirectory)
+            with self.timings.phase('store'):
+                self.useStore(TranslationStore.fromLocaleObjects(translations))
+
+    def loadKeyScopedCatalog(self, keys, languagTag=lambda filename: filename.split('.')[0]):
+        files = self.findLocaleFiles(self.translationsDirectory, languagTag)
+
+        with self.timings.phase('read'):
+            entries, errors = runPerLocale(keyscope.readKeyEntries, {language: (file, keys) for language, file in files.items()}, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'read')
+
+        self.keyScoped = True
+        self.useStore(TranslationStore.fromLocaleObjects({language: (files[language], entries[language]) for language in files.keys()}))
+
+    def isKeyCommand(self, args):
+        bulkCommands = [args.migrate, args.check, args.cleanup, args.duplicates, args.release, args.build_bundles, args.edit_prefix, args.usage_report, args.coverage, args.missing_in, args.untranslated, args.importFile, args.rename_prefix, args.rename_regex, args.delete_prefix]
+        return args.KEY is not None and not args.daemon and all(command is None or command is False for command in bulkCommands)
+
+    def isDaemonCommand(self, args):
+        localOptions = [args.dry_run, args.jobs != 1, args.processes, args.stream, args.no_cache, args.timings is not None, args.profile is not None]
+        return self.isKeyCommand(args) and not any(localOptions)
+
+    def useStore(self, store):
+        self.store = store
+        self.storeGeneration += 1
+        self.translations = self.store.translations()
+        self.dictionary = self.store.dictionary()
+        self.allKeysSorted = self.store.sortedKeys()
+        self.cachedCoverage = None
+        self.cachedKeyTrie = None
+        self.keyTree = None
 
     def translationFromDictionary(self, key, dictionary):
         return dictionary[key] if key in dictionary else {}
@@ -108,22 +214,42 @@ class App(ListViewDataSource):
 
         return result
 
+    def buildEditorContentForKeys(self, keys, dictionary, allLanguages):
+        return '\n\n'.join(self.buildEditorContent(key, self.translationFromDictionary(key, dictionary), allLanguages) for key in keys)
+
+    def parseEditorContent(self, content):
+        parts = EDITOR_KEY_LINE.split(EDITOR_COMMENT_LINE.sub('', content))
+        result = {}
+        for key, jsonString in zip(parts[1::2], parts[2::2]):
+            result[key.strip()] = json.loads(jsonString)
+
+        return result
+
     def openEditor(self, key, dictionary, allLanguages):
         entry = self.translationFromDictionary(key, dictionary)
         editorContent = self.buildEditorContent(key, entry, allLanguages)
 
+        return self.editContent(editorContent)
+
+    def editContent(self, editorContent):
+        _, updatedContent = self.editAndSave(editorContent)
+        return (updatedContent != editorContent, updatedContent)
+
+    def editAndSave(self, editorContent):
         EDITOR = os.environ.get('EDITOR', 'vim')
         with tempfile.NamedTemporaryFile(suffix='.tmp', mode='w+') as tf:
             tf.write(editorContent)
             tf.flush()
-            call([EDITOR, '+set backupcopy=yes', tf.name])
+            modified = os.stat(tf.name).st_mtime_ns
+            with self.timings.phase('editor'):
+                call([EDITOR, '+set backupcopy=yes', tf.name])
 
             tf.seek(0)
             updatedContent = tf.read()
             updatedContent = updatedContent.strip()
-            changed = updatedContent != editorContent
+            saved = os.stat(tf.name).st_mtime_ns != modified or updatedContent != editorContent
 
-            return (changed, updatedContent)
+            return (saved, updatedContent)
 
 
     def getDiff(self, old, new, allLanguages):
@@ -145,22 +271,77 @@ class App(ListViewDataSource):
         return result
 
     def applyDiff(self, key, diff, translations):
+        changeSet = ChangeSet(translations)
+        self.recordDiff(key, diff, changeSet)
+        self.commitChanges(changeSet)
+
+    def recordDiff(self, key, diff, changeSet):
         for lang, newValue, oldValue, diffType in diff:
-            path, translationObject = translations[lang]
 
             if Diff.ADDED == diffType:
-                translationObject[key] = newValue
+                changeSet.set(lang, key, newValue)
 
             elif Diff.UPDATED == diffType:
-                translationObject[key] = newValue
+                changeSet.set(lang, key, newValue)
 
             elif Diff.DELETED == diffType:
-                if key in translationObject:
-                    del translationObject[key]
-                else:
-                    continue
+                changeSet.delete(lang, key)
 
-            self.saveTranslationClean(path, translationObject)
+    def resolveLanguage(self, language, allLanguages):
+        if language in allLanguages:
+            return language
+
+        for candidate in [language.lower(), language.split('-')[0].lower(), language.split('_')[0].lower()]:
+            if candidate in allLanguages:
+                return candidate
+
+        return None
+
+    def importTranslations(self, path, dryRun=False):
+        allLanguages = list(self.translations.keys())
+        allLanguages.sort()
+
+        changeSet = ChangeSet(self.translations)
+        counts = {lang: {Diff.ADDED: 0, Diff.UPDATED: 0, Diff.DELETED: 0} for lang in allLanguages}
+        unknownLanguages = set()
+        numberOfRecords = 0
+
+        try:
+            for key, values in readImportRecords(path):
+                numberOfRecords += 1
+                old = self.translationFromDictionary(key, self.dictionary)
+                new = dict(old)
+
+                for language, value in values.items():
+                    lang = self.resolveLanguage(language, allLanguages)
+                    if lang is None:
+                        unknownLanguages.add(language)
+                    elif value is None:
+                        new.pop(lang, None)
+                    else:
+                        new[lang] = value
+
+                diff = self.getDiff(old, new, allLanguages)
+                self.recordDiff(key, diff, changeSet)
+                for lang, _, _, diffType in diff:
+                    counts[lang][diffType] += 1
+
+        except (OSError, ImportFileError, ParseError, csv.Error, UnicodeDecodeError) as e:
+            print('Could not import \'{}\': {}'.format(path, e), file=sys.stderr)
+            exit(-5)
+
+        if len(unknownLanguages) > 0:
+            print('Could not import \'{}\': unknown locales {}'.format(path, ', '.join(sorted(unknownLanguages))), file=sys.stderr)
+            exit(-5)
+
+        if not dryRun:
+            self.commitChanges(changeSet)
+
+        print('Imported {} records from \'{}\'{}'.format(numberOfRecords, path, ' (dry run, nothing written)' if dryRun else ''))
+        print('{:<8}{:>10}{:>10}{:>10}'.format('locale', 'added', 'updated', 'deleted'))
+        for lang in allLanguages:
+            count = counts[lang]
+            print('{:<8}{:>10}{:>10}{:>10}'.format(lang, count[Diff.ADDED], count[Diff.UPDATED], count[Diff.DELETED]))
 
     def buildTranslationLine(self, key, value, blockLevel, indentation='    '):
         return '\n{}{}: {},'.format(indentation*blockLevel, key.__repr__(), value.__repr__())
@@ -182,9 +363,7 @@ class App(ListViewDataSource):
         file.close()
 
         content = re.sub(updatePattern, replacement, content)
-        file = open(filePath, 'w')
-        file.write(content)
-        file.close()
+        writeFileAtomically(filePath, content.encode('utf-8'))
 
     def changeTranslationLine(self, filePath, key, newValue, oldValue):
         line = ''
@@ -206,10 +385,7 @@ class App(ListViewDataSource):
         index = self.findNthOccurrence(content, '{', blockLevel)
         index = index+1
         content = content[:index] + line + content[index:]
-
-        file = open(filePath, 'w')
-        file.write(content)
-        file.close()
+        writeFileAtomically(filePath, content.encode('utf-8'))
 
 
     def updateTranslation(self, key, content, dictionary, allLanguages):
@@ -221,6 +397,109 @@ class App(ListViewDataSource):
         diff = self.getDiff(old, new, allLanguages)
         self.applyDiff(key, diff, self.translations)
 
+    def editTranslationsForKeys(self, keys):
+        allLanguages = sorted(self.translations.keys())
+        changed, content = self.editContent(self.buildEditorContentForKeys(keys, self.dictionary, allLanguages))
+        if not changed:
+            return False
+
+        entries = self.parseEditedTranslations(content)
+        entries = self.completeWithSuggestions(entries, allLanguages)
+
+        changeSet = ChangeSet(self.translations)
+        for key, new in entries.items():
+            old = self.translationFromDictionary(key, self.dictionary)
+            self.recordDiff(key, self.getDiff(old, new, allLanguages), changeSet)
+
+        self.commitChanges(changeSet)
+        return not changeSet.isEmpty()
+
+    def parseEditedTranslations(self, content):
+        try:
+            return self.parseEditorContent(content)
+        except ValueError as e:
+            print('Could not parse the edited translations: {}'.format(e), file=sys.stderr)
+            exit(-5)
+
+    def referenceTexts(self):
+        if REFERENCE_LOCALE not in self.translations:
+            return {}
+
+        if self.keyScoped:
+            with self.timings.phase('read'):
+                reference = readJsonFile(self.translations.path(REFERENCE_LOCALE), self.streaming)
+        else:
+            reference = self.store.localeObject(REFERENCE_LOCALE)
+
+        return {key: value for key, value in reference.items() if isinstance(value, str)}
+
+    def suggestionIndex(self):
+        if self.cachedSuggestionIndex is None:
+            self.cachedSuggestionIndex = SuggestionCache(self.translationsDirectory).load()
+
+        if self.suggestionIndexGeneration != self.storeGeneration or (not self.keyScoped and len(self.store.changes) > 0):
+            texts = self.referenceTexts()
+            with self.timings.phase('suggestion index'):
+                if self.cachedSuggestionIndex.sync(texts):
+                    SuggestionCache(self.translationsDirectory).save(self.cachedSuggestionIndex)
+            self.suggestionIndexGeneration = self.storeGeneration
+
+        return self.cachedSuggestionIndex
+
+    def readEntries(self, keys):
+        if not self.keyScoped:
+            return {key: self.dictionary[key] for key in keys if key in self.dictionary}
+
+        files = {lang: self.translations.path(lang) for lang in self.translations.keys()}
+        found, errors = runPerLocale(keyscope.readKeyEntries, {lang: (file, keys) for lang, file in files.items()}, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'read')
+
+        result = {}
+        for lang, values in found.items():
+            for key, value in values.items():
+                result.setdefault(key, {})[lang] = value
+        return result
+
+    def suggestTranslations(self, text):
+        matches = self.suggestionIndex().search(text, SUGGESTION_COUNT)
+        entries = self.readEntries([key for _, key in matches])
+        return [(score, key, entries[key]) for score, key in matches if key in entries]
+
+    def buildSuggestionContent(self, key, entry, suggestions, allLanguages):
+        completed = dict(entry)
+        for lang in allLanguages:
+            if completed.get(lang) is None:
+                completed[lang] = next((translations[lang] for _, _, translations in suggestions if lang in translations), None)
+
+        comments = ['{}Suggestions for {}:'.format(EDITOR_COMMENT, entry[REFERENCE_LOCALE].__repr__())]
+        for score, suggestedKey, translations in suggestions:
+            comments.append('{}{:.0%} {} {}'.format(EDITOR_COMMENT, score, suggestedKey, translations.get(REFERENCE_LOCALE).__repr__()))
+
+        header, jsonContent = self.buildEditorContent(key, completed, allLanguages).split('\n', 1)
+        return '\n'.join([header] + comments + [jsonContent])
+
+    def completeWithSuggestions(self, entries, allLanguages):
+        blocks = []
+        for key, entry in entries.items():
+            isIncomplete = any(entry.get(lang) is None for lang in allLanguages)
+            if key in self.dictionary or not isIncomplete or not isinstance(entry.get(REFERENCE_LOCALE), str):
+                continue
+
+            suggestions = self.suggestTranslations(entry[REFERENCE_LOCALE])
+            if len(suggestions) > 0:
+                blocks.append(self.buildSuggestionContent(key, entry, suggestions, allLanguages))
+
+        if len(blocks) == 0:
+            return entries
+
+        saved, content = self.editAndSave('\n\n'.join(blocks))
+        if not saved:
+            return entries
+
+        result = dict(entries)
+        result.update(self.parseEditedTranslations(content))
+        return result
+
     def editTranslationForKey(self, key, dictionary, translations):
         allLanguages = list(translations.keys())
         allLanguages.sort()
@@ -277,71 +556,382 @@ class App(ListViewDataSource):
             help="Cleans up all *.json files",
             action="store_true"
         )
+        group.add_argument(
+            '--check',
+            help="Checks that all *.json files are clean without writing anything and fails if not",
+            action="store_true"
+        )
+        group.add_argument(
+            '--import',
+            help="Imports all translations of a CSV, XLIFF or JSONL file",
+            metavar='FILE',
+            dest='importFile'
+        )
+        group.add_argument(
+            '--rename-prefix',
+            help="Renames all keys starting with OLD so that they start with NEW",
+            nargs=2,
+            metavar=('OLD', 'NEW')
+        )
+        group.add_argument(
+            '--rename-regex',
+            help="Renames all keys matching PATTERN by substituting it with REPLACEMENT",
+            nargs=2,
+            metavar=('PATTERN', 'REPLACEMENT')
+        )
+        group.add_argument(
+            '--delete-prefix',
+            help="Deletes all keys starting with PREFIX",
+            metavar='PREFIX'
+        )
+        group.add_argument(
+            '--build-bundles',
+            help="Writes one minified, content-hashed file per locale and group plus a manifest to OUT",
+            metavar='OUT'
+        )
+        group.add_argument(
+            '--edit-prefix',
+            help="Edits all keys starting with PREFIX in one editor session",
+            metavar='PREFIX'
+        )
+        group.add_argument(
+            '--usage-report',
+            help="Scans the sources in $JHA_HOME for unused, missing and incompletely translated keys",
+            action="store_true"
+        )
+        group.add_argument(
+            '--coverage',
+            help="Prints the translation coverage of every locale and every group",
+            action="store_true"
+        )
+        group.add_argument(
+            '--missing-in',
+            help="Lists all keys without a translation for any of the given locales",
+            nargs='+',
+            metavar='LOCALE'
+        )
+        group.add_argument(
+            '--untranslated',
+            help="Lists all keys whose translation is identical to the '{}' one, for the given locales or all locales".format(REFERENCE_LOCALE),
+            nargs='*',
+            metavar='LOCALE'
+        )
+        group.add_argument(
+            '--duplicates',
+            help="Reports keys with identical translations, per locale and across all locales, ranked by the bytes a consolidation would save (default: exact, normalized ignores whitespace and case)",
+            choices=NORMALIZATIONS,
+            nargs='?',
+            const=NORMALIZATIONS[0]
+        )
+        group.add_argument(
+            '--daemon',
+            help="Keeps the translations in memory and serves other invocations until stopped",
+            action="store_true"
+        )
+        group.add_argument(
+            '--stop-daemon',
+            help="Stops a running daemon",
+            action="store_true"
+        )
+        argparser.add_argument(
+            '--no-daemon',
+            help="Does not use a running daemon",
+            action="store_true"
+        )
+        argparser.add_argument(
+            '--release',
+            help="Writes every locale as minified, content-hashed JSON with precompressed siblings plus a manifest to OUT (can be combined with --cleanup or --build-bundles)",
+            metavar='OUT'
+        )
+        argparser.add_argument(
+            '--rename-plan',
+            help="Writes the keys that could be replaced by an identical key in all locales as JSON to FILE (with --duplicates)",
+            metavar='FILE'
+        )
+        argparser.add_argument(
+            '--present-in',
+            help="Only lists keys with a translation for all of the given locales (with --missing-in)",
+            nargs='+',
+            metavar='LOCALE',
+            default=[]
+        )
+        argparser.add_argument(
+            '--dry-run',
+            help="Only reports what would be changed without writing any file",
+            action="store_true"
+        )
+        argparser.add_argument(
+            '-j',
+            '--jobs',
+            help="Number of locales that are read and written in parallel (default: 1, without N: number of CPUs)",
+            metavar='N',
+            type=int,
+            nargs='?',
+            const=defaultJobs(),
+            default=1
+        )
+        argparser.add_argument(
+            '--processes',
+            help="Uses a process pool instead of a thread pool for --jobs",
+            action="store_true"
+        )
+        argparser.add_argument(
+            '--stream',
+            help="Reads the *.json files incrementally instead of loading each file into memory at once",
+            action="store_true"
+        )
+        argparser.add_argument(
+            '--no-cache',
+            help="Bypasses the cache of parsed translations and reads all *.json files",
+            action="store_true"
+        )
+        argparser.add_argument(
+            '--timings',
+            help="Prints wall and CPU time, bytes read and written and peak memory of every phase to stderr, either as a summary table or as JSON lines (default: summary, also enabled by ${})".format(TIMINGS_VARIABLE),
+            choices=TIMINGS_FORMATS,
+            nargs='?',
+            const=TIMINGS_FORMATS[0]
+        )
+        argparser.add_argument(
+            '--profile',
+            help="Writes a cProfile statistics file of the whole run to FILE (readable with pstats)",
+            metavar='FILE'
+        )
+
+        args = argparser.parse_args()
+        releaseConflicts = [args.delete, args.rename, args.migrate, args.check, args.importFile, args.rename_prefix, args.rename_regex, args.delete_prefix, args.edit_prefix, args.usage_report, args.coverage, args.missing_in, args.untranslated, args.duplicates, args.daemon, args.stop_daemon]
+        if args.release is not None and (args.KEY is not None or any(option is not None and option is not False for option in releaseConflicts)):
+            argparser.error('--release can only be combined with --cleanup or --build-bundles')
+        if args.release is not None and args.build_bundles is not None and os.path.abspath(args.release) == os.path.abspath(args.build_bundles):
+            argparser.error('--release and --build-bundles need different output directories')
 
-        return argparser.parse_args()
+        return args
 
     def migrateTsToJson(self, translations):
+        migrated = {}
         for locale, (file, jsonObject) in translations.items():
             directory = os.path.dirname(file)
             filename = '{}.json'.format(locale)
-            path = os.path.join(directory, filename)
-            self.saveTranslationClean(path, jsonObject)
-            print("Migrated {} translations from '{}' to '{}'".format(len(jsonObject), file, path))
+            migrated[locale] = (os.path.join(directory, filename), jsonObject)
+
+        self.saveTranslationsClean(migrated, migrated.keys())
+        for locale, (file, jsonObject) in translations.items():
+            print("Migrated {} translations from '{}' to '{}'".format(len(jsonObject), file, migrated[locale][0]))
+
+    def checkTranslations(self):
+        files = self.findLocaleFiles(self.translationsDirectory)
+
+        with self.timings.phase('check'):
+            results, errors = runPerLocale(checkGroupedJsonFile, {lang: (file,) for lang, file in files.items()}, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'check')
+
+        clean = True
+        for lang, file in files.items():
+            groups = results[lang]
+            if groups is None:
+                continue
+
+            clean = False
+            if len(groups) > 0:
+                print("Translations for locale '{}' in '{}' are not clean in groups: {}".format(lang, file, ', '.join(group or '(none)' for group in groups)), file=sys.stderr)
+            else:
+                print("Translations for locale '{}' in '{}' are not clean".format(lang, file), file=sys.stderr)
+
+        if not clean:
+            exit(-7)
+
+        print('All {} locales in \'{}\' are clean'.format(len(files), self.translationsDirectory))
 
     def saveTranslationClean(self, path, jsonObject):
-        outJson = self.buildGroupedJson(jsonObject)
-        file = open(path, 'w')
-        file.write(outJson)
-        file.close()
+        saveGroupedJsonFile(path, jsonObject)
+
+    def saveTranslationsClean(self, translations, languages):
+        arguments = {lang: translations[lang] for lang in languages}
+        with self.timings.phase('write'):
+            written, errors = runPerLocale(saveGroupedJsonFile, arguments, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, {lang: path for lang, (path, _) in arguments.items()}, 'write')
+
+        return written
+
+    def buildBundles(self, outputDirectory):
+        oldManifest = bundles.readManifest(outputDirectory)
+
+        arguments = {lang: (outputDirectory, lang, jsonObject) for lang, (_, jsonObject) in self.translations.items()}
+        with self.timings.phase('bundles'):
+            results, errors = runPerLocale(bundles.buildLocaleBundles, arguments, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, {lang: outputDirectory for lang in arguments.keys()}, 'build bundles of')
+
+        manifest = {lang: entries for lang, (entries, _) in results.items()}
+        with self.timings.phase('write'):
+            bundles.writeManifest(outputDirectory, manifest)
+            removed = bundles.removeStaleFiles(outputDirectory, oldManifest, manifest)
+
+        for lang in sorted(results.keys()):
+            entries, written = results[lang]
+            print('Built {} bundles for language [{}] in {} ({} changed)'.format(len(entries), lang.upper(), os.path.join(outputDirectory, lang), written))
+        if removed > 0:
+            print('Removed {} outdated bundles'.format(removed))
+
+    def writeRelease(self, outputDirectory):
+        oldManifest = bundles.readManifest(outputDirectory)
+
+        arguments = {lang: (outputDirectory, lang, jsonObject) for lang, (_, jsonObject) in self.translations.items()}
+        with self.timings.phase('release'):
+            results, errors = runPerLocale(bundles.buildReleaseFile, arguments, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, {lang: outputDirectory for lang in arguments.keys()}, 'write release files of')
+
+        manifest = {lang: name for lang, (name, _) in results.items()}
+        with self.timings.phase('write'):
+            bundles.writeManifest(outputDirectory, manifest)
+            bundles.removeStaleFiles(outputDirectory, oldManifest, manifest)
+
+        for lang in sorted(results.keys()):
+            name, written = results[lang]
+            print('{} release file for language [{}] {}'.format('Wrote' if written else 'Unchanged', lang.upper(), os.path.join(outputDirectory, name)))
+
+    def commitChanges(self, changeSet):
+        if self.keyScoped:
+            return self.commitKeyScopedChanges(changeSet)
+
+        return self.saveTranslationsClean(changeSet.translations, changeSet.languages())
+
+    def commitKeyScopedChanges(self, changeSet):
+        files = {lang: self.translations.path(lang) for lang in changeSet.languages()}
+        arguments = {lang: (file,) + self.store.localeChanges(lang) + (self.streaming,) for lang, file in files.items()}
+        with self.timings.phase('write'):
+            written, errors = runPerLocale(keyscope.applyKeyChanges, arguments, self.jobs, self.useProcesses)
+        self.reportLocaleErrors(errors, files, 'write')
+
+        return written
 
     def buildGroupedJson(self, jsonObject):
-        jsonDict = {
-            'key': list(jsonObject.keys()),
-            'value': list(jsonObject.values())
-        }
-        pd = import_module('pandas')
-        df = pd.DataFrame(jsonDict)
-        df = df.sort_values(by='key')
-        df['group'] = df.apply(lambda row: row.key.split('.')[0] if '.' in row.key else '', axis=1)
-
-        complete = []
-        for groupName, group in df.groupby(['group']):
-            groupDict = dict(zip(group.key, group.value))
-            groupJson = json.dumps(groupDict, ensure_ascii=False, indent=4, sort_keys=True)
-            groupJson = groupJson[1:-1]
-            groupJson = groupJson.rstrip()
-            complete.append(groupJson)
-
-        result = '{' + (',\n'.join(complete)) + '\n}'
-        return result
+        return groupedjson.buildGroupedJson(jsonObject)
 
     def __init__(self, jhaHome):
         self.translationsPattern = TRANSLATIONS_PATTERN_JSON
         self.jhaHome = jhaHome
         self.__filter = ''
-        self.filterCriteria = ['KEY', 'TRANSLATION']
+        self.filterCriteria = ['KEY', 'TRANSLATION', 'MISSING']
         self.__activeFilterCriteria = self.filterCriteria[0]
+        self.__filteredKeys = []
+        self.__filteredTranslationItems = []
+        self.searchWorker = None
+        self.searchIndices = {}
+        self.cachedCoverage = None
+        self.cachedKeyTrie = None
+        self.keyTree = None
+        self.treeMode = False
+        self.markedKeys = set()
+        self.cachedSuggestionIndex = None
+        self.suggestionIndexGeneration = None
+        self.storeGeneration = 0
+        self.keyScoped = False
+        self.jobs = 1
+        self.useProcesses = False
+        self.streaming = False
+        self.timings = Timings(formatFromEnvironment())
+        self.profiler = Profiler()
+        self.translationsDirectory = os.path.join(self.jhaHome, TRANSLATIONS_SUBDIRECTORY)
 
+    def run(self):
         args = self.parseArgs()
+        self.jobs = max(1, args.jobs)
+        self.useProcesses = args.processes
+        self.streaming = args.stream
+        if args.timings is not None:
+            self.timings = Timings(args.timings)
+        self.profiler = Profiler(args.profile)
+
+        self.profiler.start()
+        try:
+            self.runCommand(args)
+        finally:
+            self.profiler.stop()
+            self.timings.printSummary()
+
+    def runCommand(self, args):
+        if args.stop_daemon:
+            self.stopDaemon()
+            exit()
 
-        self.translationsDirectory = os.path.join(self.jhaHome, TRANSLATIONS_SUBDIRECTORY)
+        if not args.daemon and not args.no_daemon and self.runWithDaemon(args):
+            exit()
 
         if args.migrate:
             self.translationsPattern = TRANSLATIONS_PATTERN_TS
             self.translations = self.readTranslationsFromTypeScript(self.translationsDirectory)
             self.migrateTsToJson(self.translations)
             exit()
+        elif args.check:
+            self.checkTranslations()
+            exit()
+        elif self.isKeyCommand(args):
+            self.loadKeyScopedCatalog([args.KEY] if args.rename is None else [args.KEY, args.rename])
         else:
-            self.translations = self.readTranslationsFromJson(self.translationsDirectory)
+            self.loadCatalog(useCache=not args.no_cache)
+
+        if args.daemon:
+            TranslationDaemon(self).serve()
+            exit()
+
+        if args.release is not None:
+            self.writeRelease(args.release)
+            if not args.cleanup and args.build_bundles is None:
+                exit()
 
         if args.cleanup:
+            written = self.saveTranslationsClean(self.translations, self.translations.keys())
             for key in self.translations.keys():
-                path, jsonObject = self.translations[key]
-                self.saveTranslationClean(path, jsonObject)
-                print("Cleaned up translations for locale '{}' in '{}'".format(key, path))
+                path = self.translations.path(key)
+                if written[key]:
+                    print("Cleaned up translations for locale '{}' in '{}'".format(key, path))
+                else:
+                    print("Translations for locale '{}' in '{}' are already clean".format(key, path))
             exit()
 
-        self.dictionary = self.buildTranslationsDictionary(self.translations)
+        if args.importFile is not None:
+            self.importTranslations(args.importFile, args.dry_run)
+            exit()
+
+        if args.build_bundles is not None:
+            self.buildBundles(args.build_bundles)
+            exit()
+
+        if args.edit_prefix is not None:
+            self.editPrefix(args.edit_prefix)
+            exit()
+
+        if args.usage_report:
+            self.usageReport()
+            exit()
+
+        if args.coverage:
+            self.coverageReport()
+            exit()
+
+        if args.duplicates is not None:
+            self.duplicatesReport(args.duplicates, args.rename_plan)
+            exit()
+
+        if args.missing_in is not None:
+            self.printKeys(self.coverageQuery(lambda coverage: coverage.missingIn(args.missing_in, args.present_in), args.missing_in + args.present_in))
+            exit()
+
+        if args.untranslated is not None:
+            self.printKeys(self.coverageQuery(lambda coverage: coverage.untranslated(args.untranslated), args.untranslated))
+            exit()
+
+        if args.rename_prefix is not None:
+            self.renamePrefix(args.rename_prefix[0], args.rename_prefix[1], args.dry_run)
+            exit()
+
+        if args.rename_regex is not None:
+            self.renameRegex(args.rename_regex[0], args.rename_regex[1], args.dry_run)
+            exit()
+
+        if args.delete_prefix is not None:
+            self.deletePrefix(args.delete_prefix, args.dry_run)
+            exit()
 
         if args.KEY is not None:
             key = args.KEY
@@ -356,20 +946,72 @@ class App(ListViewDataSource):
                 self.openKey(key)
 
         else:
-            self.allKeysSorted = list(self.dictionary.keys())
-            self.allKeysSorted.sort()
-            self.applyFilter()
+            import curses
+            from lib.interactive import UI
 
-            self.allTranslationItems = []
-            for key, trnsl in self.dictionary.items():
-                for lang, value in trnsl.items():
-                    self.allTranslationItems.append((key, lang, value))
+            self.applyFilter()
 
             ui = UI(self)
-            curses.wrapper(ui.loop)
+            with self.timings.buffered():
+                curses.wrapper(ui.loop)
+
+    def runWithDaemon(self, args):
+        if not self.isDaemonCommand(args):
+            return False
+
+        client = DaemonClient.connect(self.translationsDirectory)
+        if client is None:
+            return False
+
+        try:
+            if args.delete:
+                response = client.request('delete', key=args.KEY)
+            elif args.rename:
+                response = client.request('rename', key=args.KEY, newKey=args.rename)
+            else:
+                response = self.editWithDaemon(client, args.KEY)
+        finally:
+            client.close()
+
+        if response is None:
+            return False
+
+        print(response.get('stdout', ''), end='')
+        print(response.get('stderr', ''), end='', file=sys.stderr)
+        if response.get('code', 0) != 0:
+            exit(response['code'])
+
+        return True
+
+    def editWithDaemon(self, client, key):
+        allLanguages = client.request('languages')['result']
+        response = client.request('entry', key=key)
+        if not response['exists']:
+            return None
+        entry = response['result']
+
+        changed, content = self.openEditor(key, {key: entry}, allLanguages)
+        if not changed:
+            return {'ok': True}
+
+        return client.request('update', key=key, content=content)
+
+    def stopDaemon(self):
+        client = DaemonClient.connect(self.translationsDirectory)
+        if client is None:
+            print('No daemon is running for \'{}\'.'.format(self.translationsDirectory), file=sys.stderr)
+            exit(-6)
+
+        try:
+            client.request('shutdown')
+        finally:
+            client.close()
 
     def openKey(self, key):
-        self.editTranslationForKey(key, self.dictionary, self.translations)
+        if key not in self.dictionary:
+            self.editTranslationsForKeys([key])
+        else:
+            self.editTranslationForKey(key, self.dictionary, self.translations)
 
     def assertKeyExists(self, key):
         if key not in self.dictionary:
@@ -384,42 +1026,324 @@ class App(ListViewDataSource):
     def deleteKey(self, key):
         self.assertKeyExists(key)
 
+        changeSet = ChangeSet(self.translations)
         for lang in self.translations.keys():
-            path, jsonObject = self.translations[lang]
+            changeSet.delete(lang, key)
 
-            if key in jsonObject.keys():
-                del jsonObject[key]
-                self.saveTranslationClean(path, jsonObject)
-                print('Removed key {} from language [{}] in {}'.format(key.__repr__(), lang.upper(), path))
+        self.commitChanges(changeSet)
+        for lang in changeSet.languages():
+            path = self.translations.path(lang)
+            print('Removed key {} from language [{}] in {}'.format(key.__repr__(), lang.upper(), path))
 
     def renameKey(self, key, newKey):
         self.assertKeyExists(key)
         self.assertKeyNotUsed(newKey)
 
+        changeSet = ChangeSet(self.translations)
+        for lang in self.translations.keys():
+            changeSet.rename(lang, key, newKey)
+
+        self.commitChanges(changeSet)
+        for lang in changeSet.languages():
+            path = self.translations.path(lang)
+            print('Renamed key {} to {} for language [{}] in {}'.format(key.__repr__(), newKey, lang.upper(), path))
+
+    def keysWithPrefix(self, prefix):
+        index = bisect_left(self.allKeysSorted, prefix)
+        result = []
+        while index < len(self.allKeysSorted) and self.allKeysSorted[index].startswith(prefix):
+            result.append(self.allKeysSorted[index])
+            index += 1
+
+        return result
+
+    def assertPrefixNotEmpty(self, prefix):
+        if len(prefix) == 0:
+            print('The prefix must not be empty.', file=sys.stderr)
+            exit(-3)
+
+    def assertRenamesValid(self, renames):
+        collisions = []
+        targets = {}
+        for key, newKey in renames.items():
+            if len(newKey) == 0:
+                collisions.append('Key \'{}\' would be renamed to an empty key.'.format(key))
+            elif newKey in targets:
+                collisions.append('Keys \'{}\' and \'{}\' would both be renamed to \'{}\'.'.format(targets[newKey], key, newKey))
+            elif newKey in self.dictionary and newKey not in renames:
+                collisions.append('Key \'{}\' would be renamed to \'{}\' which is already being used.'.format(key, newKey))
+            targets[newKey] = key
+
+        if len(collisions) > 0:
+            for collision in collisions:
+                print(collision, file=sys.stderr)
+            exit(-3)
+
+    def renameKeys(self, renames, dryRun=False):
+        renames = {key: newKey for key, newKey in renames.items() if key != newKey}
+        if len(renames) == 0:
+            print('No keys to rename.', file=sys.stderr)
+            exit(-2)
+
+        self.assertRenamesValid(renames)
+
+        changeSet = ChangeSet(self.translations)
+        counts = {lang: changeSet.renameAll(lang, renames) for lang in self.translations.keys()}
+
+        for key, newKey in renames.items():
+            print('Renamed key {} to {}'.format(key.__repr__(), newKey))
+
+        if not dryRun:
+            self.commitChanges(changeSet)
+
+        for lang in changeSet.languages():
+            path = self.translations.path(lang)
+            print('Renamed {} keys for language [{}] in {}{}'.format(counts[lang], lang.upper(), path, ' (dry run, nothing written)' if dryRun else ''))
+
+    def renamePrefix(self, prefix, newPrefix, dryRun=False):
+        self.assertPrefixNotEmpty(prefix)
+        self.renameKeys({key: newPrefix + key[len(prefix):] for key in self.keysWithPrefix(prefix)}, dryRun)
+
+    def renameRegex(self, pattern, replacement, dryRun=False):
+        try:
+            regex = re.compile(pattern)
+            renames = {key: regex.sub(replacement, key) for key in self.allKeysSorted if regex.search(key) is not None}
+        except (re.error, IndexError) as e:
+            print('Invalid pattern or replacement: {}'.format(e), file=sys.stderr)
+            exit(-5)
+
+        self.renameKeys(renames, dryRun)
+
+    def editPrefix(self, prefix):
+        keys = self.keysWithPrefix(prefix)
+        if len(keys) == 0:
+            print('No keys start with \'{}\'.'.format(prefix), file=sys.stderr)
+            exit(-2)
+
+        self.editTranslationsForKeys(keys)
+
+    def deletePrefix(self, prefix, dryRun=False):
+        self.assertPrefixNotEmpty(prefix)
+        keys = self.keysWithPrefix(prefix)
+        if len(keys) == 0:
+            print('No keys start with \'{}\'.'.format(prefix), file=sys.stderr)
+            exit(-2)
+
+        changeSet = ChangeSet(self.translations)
+        counts = {}
         for lang in self.translations.keys():
-            path, jsonObject = self.translations[lang]
+            counts[lang] = sum(1 for key in keys if changeSet.delete(lang, key))
+
+        for key in keys:
+            print('Removed key {}'.format(key.__repr__()))
+
+        if not dryRun:
+            self.commitChanges(changeSet)
+
+        for lang in changeSet.languages():
+            path = self.translations.path(lang)
+            print('Removed {} keys from language [{}] in {}{}'.format(counts[lang], lang.upper(), path, ' (dry run, nothing written)' if dryRun else ''))
+
+    def scanSources(self, sourceDirectory):
+        with self.timings.phase('discover sources'):
+            paths = findSourceFiles(sourceDirectory, self.translationsDirectory)
+
+        usageCache = UsageCache(sourceDirectory)
+        with self.timings.phase('source cache load'):
+            cachedFiles = usageCache.load() or {}
+
+        scans = {}
+        signatures = {}
+        toScan = []
+        for path in paths:
+            signatures[path] = sourceFileSignature(path)
+            cached = cachedFiles.get(path)
+            if cached is not None and cached[0] == signatures[path]:
+                scans[path] = cached[1]
+            else:
+                toScan.append(path)
+
+        numberOfChunks = min(len(toScan), self.jobs * SCAN_CHUNKS_PER_JOB)
+        chunks = {i: (toScan[i::numberOfChunks],) for i in range(numberOfChunks)}
+        with self.timings.phase('scan'):
+            results, errors = runPerLocale(scanSourceFiles, chunks, self.jobs, self.useProcesses)
+
+        if len(errors) > 0:
+            for error in errors.values():
+                print('Could not scan sources in \'{}\': {}'.format(sourceDirectory, error), file=sys.stderr)
+            exit(-4)
+
+        for result in results.values():
+            scans.update(result)
+
+        if len(toScan) > 0 or len(cachedFiles) != len(paths):
+            with self.timings.phase('source cache save'):
+                usageCache.save({path: (signatures[path], scans[path]) for path in paths})
+
+        return scans
+
+    def usageReport(self):
+        allLanguages = sorted(self.translations.keys())
+        scans = self.scanSources(self.jhaHome)
+
+        with self.timings.phase('match'):
+            report = UsageReport(self.allKeysSorted, self.store.entry, allLanguages, scans)
+
+        print('Scanned {} source files for {} keys'.format(len(scans), len(self.allKeysSorted)))
+
+        print('\nUnused keys ({}):'.format(len(report.unused)))
+        for key in report.unused:
+            print('    ' + key)
+
+        print('\nMissing keys ({}):'.format(len(report.missing)))
+        for key in report.missing:
+            print('    {}  ({})'.format(key, ', '.join(os.path.relpath(path, self.jhaHome) for path in sorted(report.usedBy[key]))))
+
+        for lang in allLanguages:
+            keys = report.incomplete[lang]
+            if len(keys) > 0:
+                print('\nUsed keys without translation for language [{}] ({}):'.format(lang.upper(), len(keys)))
+                for key in keys:
+                    print('    ' + key)
+
+    def coverage(self):
+        if self.cachedCoverage is None:
+            with self.timings.phase('coverage'):
+                self.cachedCoverage = Coverage(self.store)
+
+        return self.cachedCoverage
+
+    def coverageQuery(self, query, locales):
+        coverage = self.coverage()
+        unknownLocales = coverage.unknownLocales(locales)
+        if len(unknownLocales) > 0:
+            print('Unknown locales: {}'.format(', '.join(unknownLocales)), file=sys.stderr)
+            exit(-5)
+
+        return query(coverage)
+
+    def printKeys(self, keys):
+        for key in keys:
+            print(key)
+
+    def coverageReport(self):
+        coverage = self.coverage()
+        numberOfKeys = len(coverage.keys)
+
+        print('{} keys, untranslated compared to [{}]'.format(numberOfKeys, (coverage.referenceLocale or '').upper()))
+        print('{:<8}{:>10}{:>10}{:>14}{:>10}'.format('locale', 'present', 'missing', 'untranslated', 'complete'))
+        for locale, (present, missing, identical) in coverage.localeSummary().items():
+            print('{:<8}{:>10}{:>10}{:>14}{:>9.1f}%'.format(locale, present, missing, identical, 100 * present / numberOfKeys if numberOfKeys > 0 else 100))
+
+        print('\n{:<32}{:>8}'.format('group', 'keys') + ''.join('{:>8}'.format(locale) for locale in coverage.locales))
+        for group, (size, completeness) in coverage.groupCompleteness().items():
+            print('{:<32}{:>8}'.format(group or '(none)', size) + ''.join('{:>7.1f}%'.format(100 * completeness[locale]) for locale in coverage.locales))
+
+    def printDuplicateGroups(self, title, groups, withLocale):
+        print('{} ({} groups, {} bytes could be saved):'.format(title, len(groups), sum(group.savedBytes for group in groups)))
+        for group in groups[:DUPLICATES_LIMIT]:
+            locale = '[{}] '.format(group.locales[0].upper()) if withLocale else ''
+            print('{:>10} bytes  {}{} keys  {}'.format(group.savedBytes, locale, len(group.keys), group.value.__repr__()))
+            print('    ' + ', '.join(group.keys))
+        if len(groups) > DUPLICATES_LIMIT:
+            print('... {} more'.format(len(groups) - DUPLICATES_LIMIT))
+
+    def duplicatesReport(self, normalization, renamePlanPath=None):
+        finder = DuplicateFinder(self.store, normalization)
+        with self.timings.phase('duplicates'):
+            acrossLocales = finder.acrossLocales()
+            perLocale = finder.perLocale()
+
+        self.printDuplicateGroups('Keys identical in all locales', acrossLocales, False)
+        print()
+        self.printDuplicateGroups('Identical translations per locale', perLocale, True)
+
+        if renamePlanPath is not None:
+            plan = finder.renamePlan(acrossLocales)
+            with open(renamePlanPath, 'w', encoding='utf-8') as file:
+                json.dump(plan, file, ensure_ascii=False, indent=4, sort_keys=True)
+            print('\nWrote a rename plan for {} keys to \'{}\''.format(len(plan), renamePlanPath))
+
+    def searchIndex(self, criteria):
+        searchIndices = self.searchIndices
+        if criteria in searchIndices:
+            return searchIndices[criteria]
+
+        generation = self.storeGeneration
+        with self.timings.phase('index ' + criteria):
+            if criteria == 'TRANSLATION':
+                index = SearchIndex(self.store.items(), self.store.values)
+            elif criteria == 'MISSING':
+                index = CoverageFilter(self.coverage())
+            else:
+                index = SearchIndex(self.allKeysSorted)
+
+        if generation == self.storeGeneration:
+            searchIndices[criteria] = index
+
+        return index
+
+    def startSearchWorker(self):
+        self.searchWorker = SearchWorker(self.searchIndex)
+
+    def applySearchResult(self, criteria, result):
+        if criteria == 'TRANSLATION':
+            self.__filteredTranslationItems = result
+        else:
+            self.__filteredKeys = result
 
-            if key in jsonObject.keys():
-                value = jsonObject[key]
-                jsonObject[newKey] = value
-                del jsonObject[key]
-                self.saveTranslationClean(path, jsonObject)
-                print('Renamed key {} to {} for language [{}] in {}'.format(key.__repr__(), newKey, lang.upper(), path))
+    def isSearching(self):
+        return self.searchWorker is not None and self.searchWorker.isSearching()
 
     def applyFilter(self):
-        if self.__activeFilterCriteria == 'TRANSLATION':
-            self.__filteredTranslationItems = list(filter(lambda item: self.__filter.lower() in item[2].lower(), self.allTranslationItems))
+        if self.searchWorker is not None:
+            self.searchWorker.submit(self.__activeFilterCriteria, self.__filter)
+
+        elif self.__activeFilterCriteria == 'TRANSLATION':
+            self.__filteredTranslationItems = self.searchIndex('TRANSLATION').search(self.__filter)
         else:
-            self.__filteredKeys = list(filter(lambda key: self.__filter.lower() in key.lower(), self.allKeysSorted))
+            self.__filteredKeys = self.searchIndex(self.__activeFilterCriteria).search(self.__filter)
+
+    def keyTrie(self):
+        if self.cachedKeyTrie is None:
+            with self.timings.phase('trie'):
+                self.cachedKeyTrie = KeyTrie(self.allKeysSorted)
+
+        return self.cachedKeyTrie
+
+    def setTreeMode(self, treeMode):
+        self.treeMode = treeMode
+        if treeMode and self.keyTree is None:
+            self.keyTree = KeyTree(self.keyTrie())
+
+    def toggleMarked(self, keys):
+        if all(key in self.markedKeys for key in keys):
+            self.markedKeys.difference_update(keys)
+        else:
+            self.markedKeys.update(keys)
+
+    def refreshAfterEdit(self):
+        expandedPaths = self.keyTree.expandedPaths() if self.keyTree is not None else set()
+        self.useStore(self.store)
+        self.searchIndices = {}
+        self.__filteredKeys = []
+        self.__filteredTranslationItems = []
+        if self.treeMode:
+            self.keyTree = KeyTree(self.keyTrie(), expandedPaths)
+        self.applyFilter()
 
     def number_of_rows(self) -> int:
-        if self.__activeFilterCriteria == 'TRANSLATION':
+        if self.treeMode:
+            return len(self.keyTree)
+        elif self.__activeFilterCriteria == 'TRANSLATION':
             return len(self.__filteredTranslationItems)
         else:
             return len(self.__filteredKeys)
 
     def get_data(self, i) -> object:
-        if self.__activeFilterCriteria == 'TRANSLATION':
+        if self.treeMode:
+            return self.keyTree[i]
+        elif self.__activeFilterCriteria == 'TRANSLATION':
             return self.__filteredTranslationItems[i]
         else:
             return self.__filteredKeys[i]
@@ -429,7 +1353,8 @@ class App(ListViewDataSource):
 
     def createNewTranslationIfPossible(self):
         if self.canCreateNewKeyFromFilter():
-            self.openKey(self.__filter)
+            return self.editTranslationsForKeys([self.__filter])
+        return False
 
     def clearFilter(self):
         self.setFilter('')
@@ -443,4 +1368,4 @@ if __name__ == '__main__':
         print('${} is not set. Please make it available in your shell containing your Just Hire Angular directory.'.format(jhaHomeVarName), file=sys.stderr)
         exit(-1)
 
-    App(jhaHome)
+    App(os.path.abspath(jhaHome)).run()
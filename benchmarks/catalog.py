@@ -0,0 +1,104 @@
+import json
+import os
+import random
+import string
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lib import groupedjson
+
+LOCALES = [
+    'en', 'de', 'fr', 'es', 'it', 'nl', 'pt', 'pl', 'sv', 'da',
+    'fi', 'nb', 'cs', 'sk', 'hu', 'ro', 'hr', 'sl', 'lt', 'lv',
+    'et', 'tr', 'el', 'bg', 'ru', 'uk', 'sr', 'ar', 'he', 'fa',
+    'hi', 'bn', 'th', 'vi', 'id', 'ms', 'ja', 'ko', 'zh', 'ca'
+]
+
+ALPHABETS = {
+    'el': [chr(c) for c in range(0x03b1, 0x03ca)],
+    'bg': [chr(c) for c in range(0x0430, 0x0450)],
+    'ru': [chr(c) for c in range(0x0430, 0x0450)],
+    'uk': [chr(c) for c in range(0x0430, 0x0450)] + ['і', 'ї', 'є'],
+    'sr': [chr(c) for c in range(0x0430, 0x0450)] + ['ђ', 'ћ', 'џ'],
+    'ar': [chr(c) for c in range(0x0627, 0x064b)],
+    'fa': [chr(c) for c in range(0x0627, 0x064b)] + ['پ', 'چ', 'ژ', 'گ'],
+    'he': [chr(c) for c in range(0x05d0, 0x05eb)],
+    'hi': [chr(c) for c in range(0x0905, 0x0939)],
+    'bn': [chr(c) for c in range(0x0985, 0x09b9)],
+    'th': [chr(c) for c in range(0x0e01, 0x0e2f)],
+    'ja': [chr(c) for c in range(0x3041, 0x3097)] + [chr(c) for c in range(0x4e00, 0x4e80)],
+    'ko': [chr(c) for c in range(0xac00, 0xac80)],
+    'zh': [chr(c) for c in range(0x4e00, 0x4f00)]
+}
+
+LATIN = list(string.ascii_lowercase) * 8 + list('äöüßéèêàçñøåłśżčřšžőű')
+DECORATIONS = ['', '', '', ' {count}', ' <b>{name}</b>', ' «…»', '\n"quoted"', ' 😀', ' \\ backslash']
+MISSING_RATIO = 0.02
+
+
+def randomWord(rnd, length, alphabet=string.ascii_lowercase):
+    return ''.join(rnd.choice(alphabet) for _ in range(length))
+
+
+def syntheticKeys(numberOfKeys, seed=0):
+    rnd = random.Random(seed)
+    groups = [randomWord(rnd, rnd.randint(3, 10)) for _ in range(max(1, numberOfKeys // 200))]
+    sections = [randomWord(rnd, rnd.randint(3, 9)) for _ in range(max(1, numberOfKeys // 50))]
+    result = set()
+    while len(result) < numberOfKeys:
+        depth = rnd.choice([0, 1, 1, 2, 2, 2, 3, 4])
+        parts = [rnd.choice(groups)] + [rnd.choice(sections) for _ in range(depth - 1)]
+        if depth > 0:
+            parts.append(randomWord(rnd, rnd.randint(2, 12)))
+        result.add('.'.join(parts))
+    return sorted(result)
+
+
+def syntheticValue(rnd, alphabet):
+    words = ' '.join(randomWord(rnd, rnd.randint(1, 9), alphabet) for _ in range(rnd.randint(1, 12)))
+    return words + rnd.choice(DECORATIONS)
+
+
+def syntheticCatalog(numberOfKeys, seed=0):
+    rnd = random.Random(seed)
+    groups = [randomWord(rnd, rnd.randint(3, 10)) for _ in range(max(1, numberOfKeys // 200))]
+    result = {}
+    while len(result) < numberOfKeys:
+        depth = rnd.randint(0, 3)
+        parts = [rnd.choice(groups)] + [randomWord(rnd, rnd.randint(2, 8)) for _ in range(depth)]
+        value = ' '.join(randomWord(rnd, rnd.randint(1, 9)) for _ in range(rnd.randint(1, 12)))
+        result['.'.join(parts)] = value + rnd.choice(['', ' äöü', ' «»', ' 日本', '\n"quoted"'])
+    return result
+
+
+def syntheticLocale(keys, locale, seed=0):
+    rnd = random.Random('{}-{}'.format(seed, locale))
+    alphabet = ALPHABETS.get(locale, LATIN)
+    missingRatio = 0 if locale == LOCALES[0] else MISSING_RATIO
+    return {key: syntheticValue(rnd, alphabet) for key in keys if rnd.random() >= missingRatio}
+
+
+def writeTypeScriptLocale(path, locale, jsonObject):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('export class {}Properties {{\n    getProperties() {{\n        return {{\n'.format(locale.capitalize()))
+        for key, value in jsonObject.items():
+            file.write('            {}: {},\n'.format(json.dumps(key, ensure_ascii=False), json.dumps(value, ensure_ascii=False)))
+        file.write('        };\n    }\n}\n')
+
+
+def writeCatalog(translationsDirectory, numberOfKeys, numberOfLocales, typeScript=False, seed=0):
+    if numberOfLocales > len(LOCALES):
+        raise ValueError('At most {} locales are supported'.format(len(LOCALES)))
+
+    os.makedirs(translationsDirectory, exist_ok=True)
+    keys = syntheticKeys(numberOfKeys, seed)
+    for locale in LOCALES[:numberOfLocales]:
+        jsonObject = syntheticLocale(keys, locale, seed)
+        if typeScript:
+            writeTypeScriptLocale(os.path.join(translationsDirectory, '{}.properties.ts'.format(locale)), locale, jsonObject)
+        else:
+            with open(os.path.join(translationsDirectory, '{}.json'.format(locale)), 'w', encoding='utf-8') as file:
+                groupedjson.writeGroupedJson(file, jsonObject)
+
+    return keys
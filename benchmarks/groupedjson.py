@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import sys
+import time
+from importlib import import_module
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lib import groupedjson
+from catalog import syntheticCatalog
+
+
+def legacyBuildGroupedJson(jsonObject):
+    jsonDict = {
+        'key': list(jsonObject.keys()),
+        'value': list(jsonObject.values())
+    }
+    pd = import_module('pandas')
+    df = pd.DataFrame(jsonDict)
+    df = df.sort_values(by='key')
+    df['group'] = df.apply(lambda row: row.key.split('.')[0] if '.' in row.key else '', axis=1)
+
+    complete = []
+    for groupName, group in df.groupby(['group']):
+        groupDict = dict(zip(group.key, group.value))
+        groupJson = json.dumps(groupDict, ensure_ascii=False, indent=4, sort_keys=True)
+        groupJson = groupJson[1:-1]
+        groupJson = groupJson.rstrip()
+        complete.append(groupJson)
+
+    result = '{' + (',\n'.join(complete)) + '\n}'
+    return result
+
+
+def measure(function, jsonObject, repeat):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        function(jsonObject)
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Compares the pandas based grouped JSON serializer with the streaming one.')
+    argparser.add_argument('--keys', type=int, nargs='+', default=[1000, 10000, 40000])
+    argparser.add_argument('--repeat', type=int, default=3)
+    args = argparser.parse_args()
+
+    try:
+        import_module('pandas')
+        hasPandas = True
+    except ImportError:
+        hasPandas = False
+        print('pandas is not installed, only the streaming serializer is measured.', file=sys.stderr)
+
+    for numberOfKeys in args.keys:
+        catalog = syntheticCatalog(numberOfKeys)
+        streaming = measure(groupedjson.buildGroupedJson, catalog, args.repeat)
+
+        if hasPandas:
+            if legacyBuildGroupedJson(catalog) != groupedjson.buildGroupedJson(catalog):
+                print('Output differs for {} keys'.format(numberOfKeys), file=sys.stderr)
+                exit(1)
+
+            legacy = measure(legacyBuildGroupedJson, catalog, args.repeat)
+            print('{:>8} keys: pandas {:8.3f}s  streaming {:8.3f}s  speedup {:6.1f}x'.format(numberOfKeys, legacy, streaming, legacy / streaming))
+        else:
+            print('{:>8} keys: streaming {:8.3f}s'.format(numberOfKeys, streaming))
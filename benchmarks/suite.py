@@ -0,0 +1,271 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from app import App, TRANSLATIONS_SUBDIRECTORY, TRANSLATIONS_PATTERN_TS
+from catalog import LOCALES, writeCatalog
+from lib import groupedjson
+from lib.store import TranslationStore
+
+APP = os.path.join(ROOT, 'app.py')
+ROW_WIDTH = 120
+ROW_LIMIT = 1000
+PHASES = [
+    'readTranslationsFromJson',
+    'readTranslationsFromTypeScript',
+    'readTranslationsCached',
+    'buildStore',
+    'searchIndex:KEY',
+    'searchIndex:TRANSLATION',
+    'applyFilter:KEY',
+    'applyFilter:TRANSLATION',
+    'build_row',
+    'buildGroupedJson',
+    'cleanup',
+    'migrate',
+    'renamePrefix',
+    'renameKey'
+]
+
+
+def measure(function, repeat, setUp=lambda: None):
+    runs = []
+    for _ in range(repeat):
+        argument = setUp()
+        begin = time.perf_counter()
+        function(argument)
+        runs.append(time.perf_counter() - begin)
+    return runs
+
+
+def result(numberOfKeys, numberOfLocales, phase, runs):
+    return {
+        'keys': numberOfKeys,
+        'locales': numberOfLocales,
+        'phase': phase,
+        'best': min(runs),
+        'median': statistics.median(runs),
+        'runs': runs
+    }
+
+
+def skipped(numberOfKeys, numberOfLocales, phase, reason):
+    return {'keys': numberOfKeys, 'locales': numberOfLocales, 'phase': phase, 'skipped': reason}
+
+
+def runApp(jhaHome, cacheHome, *arguments):
+    environment = dict(os.environ, JHA_HOME=jhaHome, XDG_CACHE_HOME=cacheHome)
+    completed = subprocess.run([sys.executable, APP, '--no-daemon'] + list(arguments), env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if completed.returncode != 0:
+        raise RuntimeError('{} failed: {}'.format(' '.join(arguments), completed.stderr.decode('utf-8', 'replace').strip()))
+
+
+def copyHome(jhaHome, workDirectory):
+    target = os.path.join(workDirectory, 'copy')
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    shutil.copytree(jhaHome, target)
+    return target
+
+
+def typedQueries(text):
+    return [text[:i] for i in range(1, len(text) + 1)]
+
+
+def filterQuery(app, criteria):
+    keys = app.allKeysSorted
+    if criteria == 'KEY':
+        return keys[len(keys) // 2][:8]
+
+    words = [word for word in app.store.values[len(app.store.values) // 2].split() if len(word) >= 3]
+    return words[0][:6] if len(words) > 0 else app.store.values[0][:3]
+
+
+def measureFilter(app, criteria, repeat):
+    queries = typedQueries(filterQuery(app, criteria))
+
+    def setUp():
+        app.searchIndices = {}
+        app.searchIndex(criteria)
+        app.setActiveFilterCriteria(criteria)
+
+    def typeQuery(_):
+        for query in queries:
+            app.setFilter(query)
+
+    runs = measure(typeQuery, repeat, setUp)
+    app.clearFilter()
+    return runs
+
+
+def measureRows(app, repeat):
+    try:
+        import curses
+        from lib.interactive import UI
+    except ImportError as e:
+        return 'UI is not available: {}'.format(e)
+
+    if not sys.stdout.isatty():
+        return 'needs a terminal'
+
+    rows = [app.get_data(i) for i in range(min(ROW_LIMIT, app.number_of_rows()))]
+
+    def measureInCurses(stdscr):
+        ui = UI(app)
+        ui.setupColors()
+        return measure(lambda _: [ui.buildRow(row, False, ROW_WIDTH) for row in rows], repeat)
+
+    return curses.wrapper(measureInCurses)
+
+
+def benchmarkScale(numberOfKeys, numberOfLocales, args, workDirectory):
+    results = []
+    log = lambda phase: print('{:>8} keys {:>3} locales: {}'.format(numberOfKeys, numberOfLocales, phase), file=sys.stderr)
+
+    jsonHome = os.path.join(workDirectory, 'json')
+    tsHome = os.path.join(workDirectory, 'ts')
+    cacheHome = os.path.join(workDirectory, 'cache')
+
+    log('generating')
+    begin = time.perf_counter()
+    writeCatalog(os.path.join(jsonHome, TRANSLATIONS_SUBDIRECTORY), numberOfKeys, numberOfLocales, seed=args.seed)
+    if args.typescript:
+        writeCatalog(os.path.join(tsHome, TRANSLATIONS_SUBDIRECTORY), numberOfKeys, numberOfLocales, typeScript=True, seed=args.seed)
+    results.append(result(numberOfKeys, numberOfLocales, 'generate', [time.perf_counter() - begin]))
+
+    app = App(jsonHome)
+    app.jobs = args.jobs
+    os.environ['XDG_CACHE_HOME'] = cacheHome
+
+    def add(phase, function, setUp=lambda: None):
+        if phase not in args.phases:
+            return
+        log(phase)
+        results.append(result(numberOfKeys, numberOfLocales, phase, measure(function, args.repeat, setUp)))
+
+    add('readTranslationsFromJson', lambda _: app.readTranslationsFromJson(app.translationsDirectory))
+
+    if 'readTranslationsFromTypeScript' in args.phases:
+        if args.typescript:
+            tsApp = App(tsHome)
+            tsApp.jobs = args.jobs
+            tsApp.translationsPattern = TRANSLATIONS_PATTERN_TS
+            add('readTranslationsFromTypeScript', lambda _: tsApp.readTranslationsFromTypeScript(tsApp.translationsDirectory))
+        else:
+            results.append(skipped(numberOfKeys, numberOfLocales, 'readTranslationsFromTypeScript', 'pass --typescript'))
+
+    app.readTranslationsCached(app.translationsDirectory)
+    add('readTranslationsCached', lambda _: app.readTranslationsCached(app.translationsDirectory))
+
+    translations = app.readTranslationsFromJson(app.translationsDirectory)
+    add('buildStore', lambda _: TranslationStore.fromLocaleObjects(translations))
+    app.useStore(TranslationStore.fromLocaleObjects(translations))
+
+    for criteria in app.filterCriteria:
+        add('searchIndex:' + criteria, lambda _: app.searchIndex(criteria), lambda: app.searchIndices.clear())
+        if 'applyFilter:' + criteria in args.phases:
+            log('applyFilter:' + criteria)
+            results.append(result(numberOfKeys, numberOfLocales, 'applyFilter:' + criteria, measureFilter(app, criteria, args.repeat)))
+
+    if 'build_row' in args.phases:
+        log('build_row')
+        app.setActiveFilterCriteria('TRANSLATION')
+        runs = measureRows(app, args.repeat)
+        app.clearFilter()
+        if isinstance(runs, str):
+            results.append(skipped(numberOfKeys, numberOfLocales, 'build_row', runs))
+        else:
+            results.append(result(numberOfKeys, numberOfLocales, 'build_row', runs))
+
+    jsonObjects = [jsonObject for _, jsonObject in translations.values()]
+    add('buildGroupedJson', lambda _: [groupedjson.buildGroupedJson(jsonObject) for jsonObject in jsonObjects])
+
+    jobs = ['--jobs', str(args.jobs)]
+    add('cleanup', lambda _: runApp(jsonHome, cacheHome, '--no-cache', '--cleanup', *jobs))
+
+    if 'migrate' in args.phases:
+        if args.typescript:
+            add('migrate', lambda home: runApp(home, cacheHome, '--migrate', *jobs), lambda: copyHome(tsHome, workDirectory))
+        else:
+            results.append(skipped(numberOfKeys, numberOfLocales, 'migrate', 'pass --typescript'))
+
+    group = app.allKeysSorted[len(app.allKeysSorted) // 2].split('.')[0]
+    add('renamePrefix', lambda home: runApp(home, cacheHome, '--no-cache', '--rename-prefix', group + '.', group + '_renamed.', *jobs), lambda: copyHome(jsonHome, workDirectory))
+
+    key = app.allKeysSorted[len(app.allKeysSorted) // 3]
+    add('renameKey', lambda home: runApp(home, cacheHome, '-r', key + '_renamed', key, *jobs), lambda: copyHome(jsonHome, workDirectory))
+
+    return results
+
+
+def gitRevision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True).stdout.decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline, file):
+    baselineResults = {(r['keys'], r['locales'], r['phase']): r for r in baseline['results'] if 'best' in r}
+
+    print('{:>8} {:>8}  {:<32}{:>12}{:>12}{:>9}'.format('keys', 'locales', 'phase', 'baseline', 'current', 'ratio'), file=file)
+    for r in report['results']:
+        old = baselineResults.get((r['keys'], r['locales'], r['phase']))
+        if old is None or 'best' not in r:
+            continue
+        print('{:>8} {:>8}  {:<32}{:>11.4f}s{:>11.4f}s{:>8.2f}x'.format(r['keys'], r['locales'], r['phase'], old['best'], r['best'], r['best'] / old['best']), file=file)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Measures every phase of sg-translations on generated catalogs and writes the results as JSON.')
+    argparser.add_argument('--keys', type=int, nargs='+', default=[1000, 10000, 100000], help='Number of keys per catalog (up to 1000000)')
+    argparser.add_argument('--locales', type=int, nargs='+', default=[2, 10], help='Number of locales per catalog (up to {})'.format(len(LOCALES)))
+    argparser.add_argument('--typescript', action='store_true', help='Also generate *.properties.ts sources and measure reading and migrating them')
+    argparser.add_argument('--phases', nargs='+', choices=PHASES, default=PHASES, metavar='PHASE', help='Phases to measure: {}'.format(', '.join(PHASES)))
+    argparser.add_argument('--repeat', type=int, default=3)
+    argparser.add_argument('-j', '--jobs', type=int, default=1)
+    argparser.add_argument('--seed', type=int, default=0)
+    argparser.add_argument('-o', '--output', help='Write the JSON report to this file instead of stdout')
+    argparser.add_argument('--compare', metavar='BASELINE', help='Print the ratio of every phase to a previously written report')
+    args = argparser.parse_args()
+
+    report = {
+        'revision': gitRevision(),
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'jobs': args.jobs,
+        'repeat': args.repeat,
+        'results': []
+    }
+
+    for numberOfKeys in args.keys:
+        for numberOfLocales in args.locales:
+            workDirectory = tempfile.mkdtemp(prefix='sg-translations-benchmark-')
+            try:
+                report['results'].extend(benchmarkScale(numberOfKeys, numberOfLocales, args, workDirectory))
+            finally:
+                shutil.rmtree(workDirectory)
+
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(content + '\n')
+    else:
+        print(content)
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(report, json.load(file), sys.stdout if args.output else sys.stderr)
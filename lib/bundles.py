@@ -0,0 +1,113 @@
+import gzip
+import json
+import os
+from urllib.parse import quote
+from lib.cache import contentHash
+from lib.groupedjson import groupName
+from lib.localefiles import fileHasContent, readJsonFile, writeFileAtomically
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASH_LENGTH = 16
+MANIFEST_NAME = 'manifest.json'
+ROOT_NAMESPACE_FILE_NAME = '_'
+
+COMPRESSORS = {'.gz': lambda content: gzip.compress(content, compresslevel=9, mtime=0)}
+if brotli is not None:
+    COMPRESSORS['.br'] = lambda content: brotli.compress(content, quality=11)
+
+
+def minifiedJson(jsonObject):
+    return json.dumps(jsonObject, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+def hashedName(stem, content, extension='.json'):
+    return '{}.{}{}'.format(stem, contentHash(content)[:HASH_LENGTH], extension)
+
+def namespaceFileName(namespace):
+    return quote(namespace, safe='') if len(namespace) > 0 else ROOT_NAMESPACE_FILE_NAME
+
+def writeIfMissing(path, content):
+    written = False
+    if not os.path.exists(path):
+        writeFileAtomically(path, content)
+        written = True
+
+    for extension, compress in COMPRESSORS.items():
+        if not os.path.exists(path + extension):
+            writeFileAtomically(path + extension, compress(content))
+            written = True
+
+    return written
+
+def splitByNamespace(jsonObject):
+    result = {}
+    for key, value in jsonObject.items():
+        result.setdefault(groupName(key), {})[key] = value
+    return result
+
+def buildLocaleBundles(outputDirectory, locale, jsonObject):
+    directory = os.path.join(outputDirectory, locale)
+    os.makedirs(directory, exist_ok=True)
+
+    entries = {}
+    written = 0
+    for namespace, namespaceObject in sorted(splitByNamespace(jsonObject).items()):
+        content = minifiedJson(namespaceObject)
+        name = hashedName(namespaceFileName(namespace), content)
+        if writeIfMissing(os.path.join(directory, name), content):
+            written += 1
+        entries[namespace] = locale + '/' + name
+
+    return (entries, written)
+
+def buildReleaseFile(outputDirectory, locale, jsonObject):
+    os.makedirs(outputDirectory, exist_ok=True)
+
+    content = minifiedJson(jsonObject)
+    name = hashedName(locale, content)
+    written = writeIfMissing(os.path.join(outputDirectory, name), content)
+
+    return (name, written)
+
+def readManifest(outputDirectory):
+    try:
+        manifest = readJsonFile(os.path.join(outputDirectory, MANIFEST_NAME))
+    except (OSError, ValueError):
+        return {}
+
+    return manifest if isinstance(manifest, dict) else {}
+
+def writeManifest(outputDirectory, manifest):
+    path = os.path.join(outputDirectory, MANIFEST_NAME)
+    content = json.dumps(manifest, ensure_ascii=False, indent=4, sort_keys=True).encode('utf-8')
+    if fileHasContent(path, content):
+        return False
+
+    writeFileAtomically(path, content)
+    return True
+
+def manifestFiles(manifest):
+    if isinstance(manifest, str):
+        return {manifest}
+    if isinstance(manifest, dict):
+        return set().union(*map(manifestFiles, manifest.values()))
+    return set()
+
+def removeStaleFiles(outputDirectory, oldManifest, newManifest):
+    removed = 0
+    for name in sorted(manifestFiles(oldManifest) - manifestFiles(newManifest)):
+        path = os.path.join(outputDirectory, name)
+        if not os.path.abspath(path).startswith(os.path.abspath(outputDirectory) + os.sep):
+            continue
+
+        for siblingPath in [path] + [path + extension for extension in COMPRESSORS.keys()]:
+            try:
+                os.unlink(siblingPath)
+            except FileNotFoundError:
+                pass
+        removed += 1
+
+    return removed
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+CACHE_VERSION = 2
+CACHE_DIRECTORY_NAME = 'sg-translations'
+
+def defaultCacheDirectory():
+    xdgCacheHome = os.getenv('XDG_CACHE_HOME')
+    base = Path(xdgCacheHome) if xdgCacheHome else Path.home() / '.cache'
+    return base / CACHE_DIRECTORY_NAME
+
+def contentHash(content):
+    return hashlib.sha256(content).hexdigest()
+
+def fileContentHash(path, chunkSize=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunkSize), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class CatalogCache:
+
+    def __init__(self, translationsDirectory, cacheDirectory=None):
+        self.translationsDirectory = os.path.abspath(translationsDirectory)
+        self.cacheDirectory = Path(cacheDirectory) if cacheDirectory else defaultCacheDirectory()
+        name = hashlib.sha1(self.translationsDirectory.encode('utf-8')).hexdigest() + '.pickle'
+        self.path = self.cacheDirectory / name
+
+    def load(self):
+        try:
+            with open(self.path, 'rb') as file:
+                state = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+
+        if not isinstance(state, dict) or state.get('version') != CACHE_VERSION:
+            return None
+        if state.get('directory') != self.translationsDirectory:
+            return None
+
+        return state
+
+    def save(self, files, store):
+        state = {
+            'version': CACHE_VERSION,
+            'directory': self.translationsDirectory,
+            'files': files,
+            'store': store
+        }
+
+        try:
+            self.cacheDirectory.mkdir(parents=True, exist_ok=True)
+            fd, tmpPath = tempfile.mkstemp(dir=self.cacheDirectory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmpPath, self.path)
+            except BaseException:
+                os.unlink(tmpPath)
+                raise
+        except OSError:
+            pass
+
+    def clear(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+class StateCache:
+
+    def __init__(self, directory, suffix, version, cacheDirectory=None):
+        self.directory = os.path.abspath(directory)
+        self.version = version
+        self.cacheDirectory = Path(cacheDirectory) if cacheDirectory else defaultCacheDirectory()
+        name = hashlib.sha1(self.directory.encode('utf-8')).hexdigest() + suffix
+        self.path = self.cacheDirectory / name
+
+    def load(self):
+        try:
+            with open(self.path, 'rb') as file:
+                state = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+
+        if not isinstance(state, dict) or state.get('version') != self.version or state.get('directory') != self.directory:
+            return None
+
+        return state.get('payload')
+
+    def save(self, payload):
+        state = {'version': self.version, 'directory': self.directory, 'payload': payload}
+
+        try:
+            self.cacheDirectory.mkdir(parents=True, exist_ok=True)
+            fd, tmpPath = tempfile.mkstemp(dir=self.cacheDirectory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmpPath, self.path)
+            except BaseException:
+                os.unlink(tmpPath)
+                raise
+        except OSError:
+            pass
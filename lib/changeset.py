@@ -0,0 +1,51 @@
+from lib.store import MISSING
+
+class ChangeSet:
+
+    def __init__(self, translations):
+        self.translations = translations
+        self.store = translations.store
+        self.changedLanguages = {}
+
+    def touch(self, lang):
+        self.changedLanguages[lang] = True
+
+    def set(self, lang, key, value):
+        if self.store.get(key, lang, MISSING) == value:
+            return False
+
+        self.store.set(key, lang, value)
+        self.touch(lang)
+        return True
+
+    def delete(self, lang, key):
+        if not self.store.has(key, lang):
+            return False
+
+        self.store.delete(key, lang)
+        self.touch(lang)
+        return True
+
+    def rename(self, lang, key, newKey):
+        return self.renameAll(lang, {key: newKey}) > 0
+
+    def renameAll(self, lang, renames):
+        values = {}
+        for key in renames.keys():
+            value = self.store.get(key, lang, MISSING)
+            if value is not MISSING:
+                values[key] = value
+                self.store.delete(key, lang)
+
+        for key, value in values.items():
+            self.store.set(renames[key], lang, value)
+
+        if len(values) > 0:
+            self.touch(lang)
+        return len(values)
+
+    def languages(self):
+        return [lang for lang in self.translations.keys() if lang in self.changedLanguages]
+
+    def isEmpty(self):
+        return len(self.changedLanguages) == 0
@@ -0,0 +1,94 @@
+import re
+from itertools import accumulate, compress, repeat
+from operator import and_, eq, mul, ne, lshift, sub
+from lib.groupedjson import groupName
+from lib.store import MISSING
+
+REFERENCE_LOCALE = 'en'
+LOCALE_SEPARATOR = re.compile(r'[\s,]+')
+
+
+def masksPerKey(bits, offsets):
+    sums = list(accumulate(bits, initial=0))
+    return list(map(sub, map(sums.__getitem__, offsets[1:]), map(sums.__getitem__, offsets[:-1])))
+
+
+def countBit(masks, localeId):
+    return sum(map(and_, masks, repeat(1 << localeId))) >> localeId
+
+
+class Coverage:
+
+    def __init__(self, store, referenceLocale=REFERENCE_LOCALE):
+        store.compact()
+        self.keys = store.keys
+        self.locales = store.locales
+        self.localeIds = store.localeIds
+        self.referenceLocale = referenceLocale if referenceLocale in self.localeIds else next(iter(self.locales), None)
+
+        bits = list(map(lshift, repeat(1), store.rowLocale))
+        self.present = masksPerKey(bits, store.offsets)
+        self.identical = [0] * len(self.keys)
+
+        if self.referenceLocale is not None:
+            referenceId = self.localeIds[self.referenceLocale]
+            isReference = list(map(eq, store.rowLocale, repeat(referenceId)))
+            reference = [MISSING] * len(self.keys)
+            for keyId, value in zip(compress(store.rowKey, isReference), compress(store.values, isReference)):
+                reference[keyId] = value
+
+            same = map(eq, store.values, map(reference.__getitem__, store.rowKey))
+            isOther = map(ne, store.rowLocale, repeat(referenceId))
+            self.identical = masksPerKey(map(mul, map(mul, bits, same), isOther), store.offsets)
+
+    def mask(self, locales):
+        result = 0
+        for locale in locales:
+            result |= 1 << self.localeIds[locale]
+        return result
+
+    def unknownLocales(self, locales):
+        return [locale for locale in locales if locale not in self.localeIds]
+
+    def missingIn(self, locales=(), presentIn=()):
+        missing = self.mask(locales) if len(locales) > 0 else self.mask(self.locales)
+        required = self.mask(presentIn)
+        isMissing = map(ne, map(and_, self.present, repeat(missing)), repeat(missing))
+        isRequired = map(eq, map(and_, self.present, repeat(required)), repeat(required))
+        return list(compress(self.keys, map(and_, isMissing, isRequired)))
+
+    def untranslated(self, locales=()):
+        wanted = self.mask(locales) if len(locales) > 0 else self.mask(self.locales)
+        return list(compress(self.keys, map(and_, self.identical, repeat(wanted))))
+
+    def localeSummary(self):
+        result = {}
+        for locale, localeId in self.localeIds.items():
+            present = countBit(self.present, localeId)
+            result[locale] = (present, len(self.keys) - present, countBit(self.identical, localeId))
+        return result
+
+    def groupCompleteness(self):
+        groups = {}
+        for key, present in zip(self.keys, self.present):
+            groups.setdefault(groupName(key), []).append(present)
+
+        result = {}
+        for group, masks in sorted(groups.items()):
+            result[group] = (len(masks), {locale: countBit(masks, localeId) / len(masks) for locale, localeId in self.localeIds.items()})
+        return result
+
+
+class CoverageFilter:
+
+    def __init__(self, coverage):
+        self.coverage = coverage
+
+    def search(self, query):
+        locales = [locale if locale in self.coverage.localeIds else locale.lower() for locale in LOCALE_SEPARATOR.split(query.strip()) if len(locale) > 0]
+        if len(self.coverage.unknownLocales(locales)) > 0:
+            return []
+        return self.coverage.missingIn(locales)
+
+    def searchIncrementally(self, query, isCancelled=lambda: False):
+        yield (self.search(query), True)
@@ -0,0 +1,205 @@
+import hashlib
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+WATCH_INTERVAL = 1.0
+
+
+def socketPath(translationsDirectory):
+    directory = os.getenv('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    digest = hashlib.sha1(os.path.abspath(translationsDirectory).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(directory, 'sg-translations-{}-{}.sock'.format(os.getuid(), digest))
+
+
+def sendMessage(connection, message):
+    connection.sendall((json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8'))
+
+
+def receiveMessage(file):
+    line = file.readline()
+    if len(line) == 0:
+        return None
+    return json.loads(line.decode('utf-8'))
+
+
+class DaemonClient:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.file = connection.makefile('rb')
+
+    @staticmethod
+    def connect(translationsDirectory):
+        path = socketPath(translationsDirectory)
+        if not os.path.exists(path):
+            return None
+
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(path)
+        except OSError:
+            connection.close()
+            return None
+
+        return DaemonClient(connection)
+
+    def request(self, command, **arguments):
+        arguments['command'] = command
+        sendMessage(self.connection, arguments)
+        response = receiveMessage(self.file)
+        if response is None:
+            raise ConnectionError('The daemon closed the connection')
+        return response
+
+    def close(self):
+        self.file.close()
+        self.connection.close()
+
+
+class TranslationDaemon:
+
+    def __init__(self, app):
+        self.app = app
+        self.path = socketPath(app.translationsDirectory)
+        self.lock = threading.Lock()
+        self.running = True
+        self.signature = self.directorySignature()
+
+    def directorySignature(self):
+        result = []
+        for file in sorted(Path(self.app.translationsDirectory).rglob(self.app.translationsPattern)):
+            try:
+                stat = file.stat()
+                result.append((str(file), stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                pass
+        return tuple(result)
+
+    def reload(self):
+        self.app.loadCatalog()
+        self.signature = self.directorySignature()
+
+    def reloadIfChanged(self):
+        if self.directorySignature() != self.signature:
+            self.reload()
+
+    def watch(self):
+        while self.running:
+            threading.Event().wait(WATCH_INTERVAL)
+            with self.lock:
+                self.reloadIfChanged()
+
+    def captured(self, function, *arguments):
+        out = io.StringIO()
+        err = io.StringIO()
+        code = 0
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                function(*arguments)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 0
+
+        return {'ok': code == 0, 'code': code, 'stdout': out.getvalue(), 'stderr': err.getvalue()}
+
+    def handle(self, request):
+        command = request.get('command')
+        app = self.app
+
+        if command == 'ping':
+            return {'ok': True, 'directory': app.translationsDirectory}
+        if command == 'shutdown':
+            self.running = False
+            return {'ok': True}
+
+        self.reloadIfChanged()
+
+        if command == 'languages':
+            return {'ok': True, 'result': sorted(app.translations.keys())}
+        if command == 'entry':
+            key = request['key']
+            return {'ok': True, 'exists': key in app.dictionary, 'result': app.translationFromDictionary(key, app.dictionary)}
+
+        if command == 'update':
+            allLanguages = sorted(app.translations.keys())
+            response = self.captured(app.updateTranslation, request['key'], request['content'], app.dictionary, allLanguages)
+        elif command == 'delete':
+            response = self.captured(app.deleteKey, request['key'])
+        elif command == 'rename':
+            response = self.captured(app.renameKey, request['key'], request['newKey'])
+        else:
+            return {'ok': False, 'code': -1, 'stderr': 'Unknown command {}\n'.format(command.__repr__())}
+
+        self.reload()
+        return response
+
+    def serveConnection(self, connection):
+        file = connection.makefile('rb')
+        try:
+            while self.running:
+                request = receiveMessage(file)
+                if request is None:
+                    break
+
+                with self.lock:
+                    try:
+                        response = self.handle(request)
+                    except (KeyError, TypeError, ValueError) as e:
+                        response = {'ok': False, 'code': -1, 'stderr': 'Invalid request: {}\n'.format(e)}
+
+                sendMessage(connection, response)
+        except (OSError, ValueError):
+            pass
+        finally:
+            file.close()
+            connection.close()
+
+    def isRunning(self):
+        client = DaemonClient.connect(self.app.translationsDirectory)
+        if client is None:
+            return False
+        client.close()
+        return True
+
+    def serve(self):
+        if self.isRunning():
+            print('A daemon for \'{}\' is already running.'.format(self.app.translationsDirectory), file=sys.stderr)
+            exit(-6)
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        oldUmask = os.umask(0o177)
+        try:
+            server.bind(self.path)
+        finally:
+            os.umask(oldUmask)
+        server.listen()
+        server.settimeout(WATCH_INTERVAL)
+
+        threading.Thread(target=self.watch, daemon=True).start()
+        print('Serving translations of \'{}\' on {}'.format(self.app.translationsDirectory, self.path))
+        sys.stdout.flush()
+
+        try:
+            while self.running:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+                connection.settimeout(None)
+                threading.Thread(target=self.serveConnection, args=(connection,), daemon=True).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.running = False
+            server.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
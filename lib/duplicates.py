@@ -0,0 +1,109 @@
+from lib.coverage import REFERENCE_LOCALE
+from lib.groupedjson import encodeEntry
+
+NORMALIZATIONS = ['exact', 'normalized']
+
+
+def normalizeValue(value):
+    return ' '.join(value.split()).casefold()
+
+
+def canonicalKey(keys):
+    return min(keys, key=lambda key: (key.count('.'), len(key), key))
+
+
+def entryBytes(key, value):
+    return len(encodeEntry(key, value).encode('utf-8')) + len(',\n')
+
+
+class DuplicateGroup:
+
+    def __init__(self, locales, value, keys, savedBytes):
+        self.locales = locales
+        self.value = value
+        self.keys = keys
+        self.savedBytes = savedBytes
+
+    def canonicalKey(self):
+        return canonicalKey(self.keys)
+
+
+def collidingIndices(signatures):
+    first = {}
+    groups = {}
+    for index, signature in enumerate(signatures):
+        if signature is None:
+            continue
+
+        previous = first.setdefault(signature, index)
+        if previous != index:
+            groups.setdefault(signature, [previous]).append(index)
+
+    return groups.values()
+
+
+def splitByValue(indices, valueOf):
+    result = {}
+    for index in indices:
+        result.setdefault(valueOf(index), []).append(index)
+    return [indices for indices in result.values() if len(indices) > 1]
+
+
+class DuplicateFinder:
+
+    def __init__(self, store, normalization=NORMALIZATIONS[0]):
+        store.compact()
+        self.store = store
+        self.normalize = normalizeValue if normalization == 'normalized' else lambda value: value
+
+    def rowValue(self, row):
+        value = self.store.values[row]
+        return (self.store.rowLocale[row], self.normalize(value)) if isinstance(value, str) else None
+
+    def keyValues(self, keyId):
+        store = self.store
+        begin, end = store.offsets[keyId], store.offsets[keyId + 1]
+        if end - begin != len(store.locales) or not all(isinstance(store.values[row], str) for row in range(begin, end)):
+            return None
+        return tuple(self.normalize(store.values[row]) for row in range(begin, end))
+
+    def perLocale(self):
+        store = self.store
+        signatures = (None if value is None else hash(value) for value in map(self.rowValue, range(len(store.values))))
+
+        result = []
+        for candidates in collidingIndices(signatures):
+            for rows in splitByValue(candidates, self.rowValue):
+                keys = [store.keys[store.rowKey[row]] for row in rows]
+                kept = canonicalKey(keys)
+                saved = sum(entryBytes(key, store.values[row]) for key, row in zip(keys, rows) if key != kept)
+                result.append(DuplicateGroup([store.locales[store.rowLocale[rows[0]]]], store.values[rows[0]], keys, saved))
+
+        return sorted(result, key=lambda group: (-group.savedBytes, group.keys[0]))
+
+    def acrossLocales(self):
+        store = self.store
+        signatures = (None if values is None else hash(values) for values in map(self.keyValues, range(len(store.keys))))
+
+        result = []
+        for candidates in collidingIndices(signatures):
+            for keyIds in splitByValue(candidates, self.keyValues):
+                keys = [store.keys[keyId] for keyId in keyIds]
+                kept = canonicalKey(keys)
+                saved = 0
+                for key in keys:
+                    if key != kept:
+                        saved += sum(entryBytes(key, value) for value in store.baseEntry(key).values())
+                entry = store.baseEntry(keys[0])
+                result.append(DuplicateGroup(list(store.locales), entry.get(REFERENCE_LOCALE, entry[store.locales[0]]), keys, saved))
+
+        return sorted(result, key=lambda group: (-group.savedBytes, group.keys[0]))
+
+    def renamePlan(self, groups):
+        plan = {}
+        for group in groups:
+            kept = group.canonicalKey()
+            for key in group.keys:
+                if key != kept:
+                    plan[key] = kept
+        return plan
@@ -0,0 +1,72 @@
+import io
+import json
+from json.encoder import encode_basestring
+
+INDENTATION = '    '
+GROUP_SEPARATOR = ',\n\n'
+
+def groupName(key):
+    return key.split('.', 1)[0] if '.' in key else ''
+
+def sortedByGroup(jsonObject):
+    return sorted(jsonObject.items(), key=lambda item: (groupName(item[0]), item[0]))
+
+def encodeValue(value):
+    if isinstance(value, str):
+        return encode_basestring(value)
+
+    encoded = json.dumps(value, ensure_ascii=False, indent=len(INDENTATION), sort_keys=True)
+    return encoded.replace('\n', '\n' + INDENTATION)
+
+def encodeEntry(key, value):
+    return INDENTATION + encode_basestring(key) + ': ' + encodeValue(value)
+
+def groupedJsonBlocks(jsonObject):
+    currentGroup = None
+    entries = []
+    for key, value in sortedByGroup(jsonObject):
+        group = groupName(key)
+        if group != currentGroup and len(entries) > 0:
+            yield (currentGroup, ',\n'.join(entries))
+            entries = []
+        currentGroup = group
+        entries.append(encodeEntry(key, value))
+
+    if len(entries) > 0:
+        yield (currentGroup, ',\n'.join(entries))
+
+def writeGroupedJson(file, jsonObject):
+    file.write('{')
+
+    separator = '\n'
+    for _, block in groupedJsonBlocks(jsonObject):
+        file.write(separator + block)
+        separator = GROUP_SEPARATOR
+
+    file.write('\n}')
+
+def isGroupedJson(content, jsonObject):
+    if not content.startswith('{'):
+        return False
+
+    position = 1
+    separator = '\n'
+    for _, block in groupedJsonBlocks(jsonObject):
+        if not content.startswith(separator, position) or not content.startswith(block, position + len(separator)):
+            return False
+        position += len(separator) + len(block)
+        separator = GROUP_SEPARATOR
+
+    return content[position:] == '\n}'
+
+def differingGroups(content, jsonObject):
+    onDisk = set()
+    if content.startswith('{\n') and content.endswith('\n}'):
+        onDisk = set(content[2:-2].split(GROUP_SEPARATOR))
+
+    return [group for group, block in groupedJsonBlocks(jsonObject) if block not in onDisk]
+
+def buildGroupedJson(jsonObject):
+    buffer = io.StringIO()
+    writeGroupedJson(buffer, jsonObject)
+    return buffer.getvalue()
@@ -0,0 +1,148 @@
+import csv
+import json
+import os
+import xml.etree.ElementTree as ElementTree
+
+FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.xlf': 'xliff',
+    '.xliff': 'xliff'
+}
+
+PLACEHOLDER_ELEMENTS = ('x', 'ph', 'bx', 'ex', 'sc', 'ec', 'bpt', 'ept', 'it')
+PLACEHOLDER_TEXT_ATTRIBUTES = ('equiv-text', 'disp')
+
+
+class ImportFileError(Exception):
+    pass
+
+
+def detectFormat(path):
+    _, extension = os.path.splitext(path)
+    if extension.lower() not in FORMATS:
+        raise ImportFileError('Unsupported import format \'{}\', expected one of {}'.format(extension, ', '.join(sorted(FORMATS.keys()))))
+    return FORMATS[extension.lower()]
+
+
+def checkedValues(location, values):
+    for locale, value in values.items():
+        if not isinstance(locale, str) or len(locale) == 0:
+            raise ImportFileError('{}: expected a locale, got {}'.format(location, json.dumps(locale)))
+        if value is not None and not isinstance(value, str):
+            raise ImportFileError('{}: expected a string or null for locale \'{}\''.format(location, locale))
+    return values
+
+
+def readJsonLines(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        for lineNumber, line in enumerate(file, start=1):
+            line = line.strip()
+            if len(line) == 0:
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ImportFileError('Line {}: {}'.format(lineNumber, e))
+
+            if not isinstance(record, dict) or not isinstance(record.get('key'), str):
+                raise ImportFileError('Line {}: expected an object with a \'key\''.format(lineNumber))
+
+            key = record.pop('key')
+            location = 'Line {}'.format(lineNumber)
+            if 'locale' in record:
+                yield (key, checkedValues(location, {record['locale']: record.get('value')}))
+            else:
+                yield (key, checkedValues(location, record))
+
+
+def readCsv(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+        reader = csv.DictReader(file)
+        if reader.fieldnames is None or 'key' not in reader.fieldnames:
+            raise ImportFileError('The CSV header must contain a \'key\' column')
+
+        isLongFormat = 'locale' in reader.fieldnames and 'value' in reader.fieldnames
+        for row in reader:
+            key = row.pop('key')
+            if key is None or len(key) == 0:
+                continue
+
+            if isLongFormat:
+                if row['value'] is None:
+                    raise ImportFileError('Line {}: expected the columns key, locale and value'.format(reader.line_num))
+                yield (key, checkedValues('Line {}'.format(reader.line_num), {row['locale']: row['value']}))
+            else:
+                yield (key, {lang: value for lang, value in row.items() if lang is not None and value is not None and len(value) > 0})
+
+
+def localName(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def placeholderText(element):
+    if len(element) == 0 and element.text:
+        return element.text
+
+    for attribute in PLACEHOLDER_TEXT_ATTRIBUTES:
+        if attribute in element.attrib:
+            return element.attrib[attribute]
+
+    return None
+
+
+def elementText(element, key):
+    parts = [element.text or '']
+
+    for child in element:
+        name = localName(child.tag)
+        if name == 'mrk':
+            parts.append(elementText(child, key))
+        elif name == 'pc' and 'dispStart' in child.attrib and 'dispEnd' in child.attrib:
+            parts.extend([child.attrib['dispStart'], elementText(child, key), child.attrib['dispEnd']])
+        elif name in PLACEHOLDER_ELEMENTS and placeholderText(child) is not None:
+            parts.append(placeholderText(child))
+        else:
+            raise ImportFileError('Unit \'{}\' contains inline <{}> markup without a textual equivalent'.format(key, name))
+
+        parts.append(child.tail or '')
+
+    return ''.join(parts)
+
+
+def readXliff(path):
+    targetLanguage = None
+
+    for event, element in ElementTree.iterparse(path, events=('start', 'end')):
+        name = localName(element.tag)
+
+        if event == 'start':
+            if name == 'xliff' and 'trgLang' in element.attrib:
+                targetLanguage = element.attrib['trgLang']
+            elif name == 'file' and 'target-language' in element.attrib:
+                targetLanguage = element.attrib['target-language']
+            continue
+
+        if name in ('trans-unit', 'unit'):
+            key = element.attrib.get('resname') or element.attrib.get('id')
+            targets = [child for child in element.iter() if localName(child.tag) == 'target']
+
+            if key is not None and len(targets) > 0:
+                if targetLanguage is None:
+                    raise ImportFileError('No target language declared for unit \'{}\''.format(key))
+                yield (key, {targetLanguage: ''.join(elementText(target, key) for target in targets)})
+
+            element.clear()
+
+
+def readImportRecords(path):
+    format = detectFormat(path)
+
+    if format == 'jsonl':
+        return readJsonLines(path)
+    elif format == 'csv':
+        return readCsv(path)
+    else:
+        return readXliff(path)
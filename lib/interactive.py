@@ -1,22 +1,42 @@
 from gupy.geometry import Padding
-from gupy.view import BackgroundView, Label, HBox, ListView, ListViewDelegate, View
+from gupy.view import BackgroundView, Label, HBox, ListView, ListViewDataSource, ListViewDelegate, View
 from gupy.screen import ConstrainedBasedScreen
 from lib import colorpairs, keys, legends
+from lib.store import TranslationItem
+from lib.keytrie import TrieNode
 from pathlib import Path
 from enum import Enum
 import curses
 import subprocess
 import platform
+from functools import lru_cache
+import time
+
+ROW_CACHE_SIZE = 1024
+SEARCH_POLL_INTERVAL = 50
 
 class Clipping(Enum):
     BEGIN = 1
     END = 2
 
 
+class AppDataSource(ListViewDataSource):
+
+    def __init__(self, app):
+        self.app = app
+
+    def number_of_rows(self) -> int:
+        return self.app.number_of_rows()
+
+    def get_data(self, i) -> object:
+        return self.app.get_data(i)
+
+
 class UI(ListViewDelegate):
 
     def __init__(self, app):
         self.app = app
+        self.cachedRow = lru_cache(maxsize=ROW_CACHE_SIZE)(self.buildRow)
 
     def setupColors(self):
         curses.curs_set(0)
@@ -84,7 +104,12 @@ class UI(ListViewDelegate):
 
         screen.add_view(filterHBox, lambda w, h, v: (0, 0, w, 1))
 
-        return (filterBackground, filterHBox, filterCriteriaLabel, filterLabel)
+        searchingLabel = Label()
+        searchingLabel.attributes.append(curses.color_pair(colorpairs.HEADER_TEXT))
+        searchingLabel.attributes.append(curses.A_BOLD)
+        screen.add_view(searchingLabel, lambda w, h, v: (w-v.required_size().width-1, 0, v.required_size().width, 1))
+
+        return (filterBackground, filterHBox, filterCriteriaLabel, filterLabel, searchingLabel)
 
     def addTitle(self, screen):
 
@@ -111,7 +136,9 @@ class UI(ListViewDelegate):
         return (title_hbox, directoryLabel, patternLabel)
 
     def updateHeaderBox(self, screen, filterElements):
-        _, _, filterCriteriaLabel, filterLabel = filterElements
+        _, _, filterCriteriaLabel, filterLabel, searchingLabel = filterElements
+
+        searchingLabel.text = 'searching...' if self.app.isSearching() else ''
 
         filterLabel.text = self.app.getFilter()
 
@@ -148,11 +175,26 @@ class UI(ListViewDelegate):
         self.app.setActiveFilterCriteria(self.app.filterCriteria[index])
 
     def addListView(self, screen):
-        listView = ListView(self, self.app)
-        screen.add_view(listView, lambda w, h, v: (0, 1, w, h-2))
+        listView = ListView(self, AppDataSource(self.app))
+        footerHeight = 2 if self.app.timings.enabled else 1
+        screen.add_view(listView, lambda w, h, v: (0, 1, w, h-1-footerHeight))
 
         return listView
 
+    def addDebugLine(self, screen):
+        debugLabel = Label()
+        debugLabel.attributes.append(curses.color_pair(colorpairs.HEADER_TEXT))
+        screen.add_view(debugLabel, lambda w, h, v: (0, h-2, w, 1))
+
+        return debugLabel
+
+    def updateDebugLine(self, debugLabel, renderLatency):
+        filterLatency = self.app.searchWorker.latency
+        debugLabel.text = ' filter: {}  render: {}  rows: {}'.format(
+            '-' if filterLatency is None else '{:.1f} ms'.format(filterLatency * 1000),
+            '-' if renderLatency is None else '{:.1f} ms'.format(renderLatency * 1000),
+            self.app.number_of_rows())
+
     def clipLabel(self, label, length, indicator='...', clipping=Clipping.END):
         length = length + len(indicator)
         if clipping == Clipping.END:
@@ -163,9 +205,25 @@ class UI(ListViewDelegate):
         label.text = clippedValue
 
     def build_row(self, i, data, is_selected, width) -> View:
+        return self.cachedRow(data, is_selected, width, self.isMarked(data))
+
+    def isMarked(self, data):
+        if isinstance(data, TranslationItem):
+            return data.key in self.app.markedKeys
+        elif isinstance(data, TrieNode):
+            return data.isKey and data.path in self.app.markedKeys
+        return data in self.app.markedKeys
+
+    def buildRow(self, data, is_selected, width, marked=False) -> View:
         rowHBox = HBox()
 
-        if isinstance(data, tuple):
+        if marked:
+            markLabel = Label('*')
+            markLabel.attributes.append(curses.color_pair(colorpairs.STAGED))
+            markLabel.attributes.append(curses.A_BOLD)
+            rowHBox.add_view(markLabel, Padding(1, 0, 0, 0))
+
+        if isinstance(data, TranslationItem):
             key, lang, value = data
             langLabel = Label('[' + lang + ']')
             langLabel.attributes.append(curses.color_pair(colorpairs.LANG))
@@ -173,24 +231,37 @@ class UI(ListViewDelegate):
             valueLabel = Label(value.__repr__())
             valueLabel.attributes.append(curses.A_BOLD)
 
-            keyLabel = Label('(' + key + ')')
-            keyLabel.attributes.append(curses.color_pair(colorpairs.TRANSLATION_KEY))
-
             rowHBox.add_view(langLabel, Padding(1, 0, 0, 0))
             rowHBox.add_view(valueLabel, Padding(2, 0, 0, 0))
 
-            if rowHBox.required_size().width >= width:
-                length = (rowHBox.required_size().width - width) + 1
+            requiredWidth = rowHBox.required_size().width
+            if requiredWidth >= width:
+                length = (requiredWidth - width) + 1
                 self.clipLabel(valueLabel, length)
             else:
+                keyLabel = Label('(' + key + ')')
+                keyLabel.attributes.append(curses.color_pair(colorpairs.TRANSLATION_KEY))
                 rowHBox.add_view(keyLabel, Padding(2, 0, 0, 0))
 
+        elif isinstance(data, TrieNode):
+            marker = ('- ' if data.expanded else '+ ') if data.hasChildren() else '  '
+            nodeLabel = Label('  ' * (data.depth - 1) + marker + data.name())
+            if data.isKey:
+                nodeLabel.attributes.append(curses.A_BOLD)
+            rowHBox.add_view(nodeLabel, Padding(1, 0, 0, 0))
+
+            if data.hasChildren():
+                countLabel = Label('(' + str(data.count()) + ')')
+                countLabel.attributes.append(curses.color_pair(colorpairs.TRANSLATION_KEY))
+                rowHBox.add_view(countLabel, Padding(2, 0, 0, 0))
+
         else:
             keyLabel = Label(data)
             rowHBox.add_view(keyLabel, Padding(1, 0, 0, 0))
 
-            if rowHBox.required_size().width >= width:
-                length = (rowHBox.required_size().width - width) + 1
+            requiredWidth = rowHBox.required_size().width
+            if requiredWidth >= width:
+                length = (requiredWidth - width) + 1
                 self.clipLabel(keyLabel, length, clipping=Clipping.BEGIN)
 
         result = rowHBox
@@ -202,6 +273,42 @@ class UI(ListViewDelegate):
 
         return result
 
+    def pollSearchResults(self, stdscr):
+        isSearching = self.app.isSearching()
+
+        published = self.app.searchWorker.poll()
+        if published is not None:
+            criteria, result = published
+            self.app.applySearchResult(criteria, result)
+
+        stdscr.timeout(SEARCH_POLL_INTERVAL if isSearching else -1)
+
+    def selectedKey(self, listView):
+        data = self.app.get_data(listView.get_selected_row_index())
+        if isinstance(data, TranslationItem):
+            return data.key
+        elif isinstance(data, TrieNode):
+            return data.path
+        return data
+
+    def runEditor(self, stdscr, edit):
+        curses.def_prog_mode()
+        curses.endwin()
+        try:
+            changed = edit()
+        finally:
+            curses.reset_prog_mode()
+            stdscr.refresh()
+
+        if changed:
+            self.app.refreshAfterEdit()
+            self.cachedRow.cache_clear()
+
+    def editKeys(self, stdscr, keys):
+        self.runEditor(stdscr, lambda: self.app.editTranslationsForKeys(keys))
+        self.app.markedKeys.difference_update(keys)
+        self.cachedRow.cache_clear()
+
     def isMacOs(self):
         return platform.system() == 'Darwin'
 
@@ -214,16 +321,24 @@ class UI(ListViewDelegate):
         legendElements = self.addLegend(screen, legends.main())
         headerElements = self.addHeaderBox(screen)
         listView = self.addListView(screen)
+        debugLabel = self.addDebugLine(screen) if self.app.timings.enabled else None
+        renderLatency = None
 
         self.isFiltering = False
+        self.app.startSearchWorker()
 
         while 1:
+            self.pollSearchResults(stdscr)
             self.updateHeaderBox(screen, headerElements)
+            if debugLabel is not None:
+                self.updateDebugLine(debugLabel, renderLatency)
 
+            renderBegin = time.perf_counter()
             screen.render()
+            renderLatency = time.perf_counter() - renderBegin
 
             key = stdscr.getch()
-            if key == curses.KEY_RESIZE:
+            if key in [curses.ERR, curses.KEY_RESIZE]:
                 continue
 
             if self.isFiltering:
@@ -256,7 +371,59 @@ class UI(ListViewDelegate):
                     character = chr(key)
                     self.app.setFilter(self.app.getFilter() + character)
 
+            elif self.app.treeMode:
+                selected = listView.get_selected_row_index()
+                node = self.app.get_data(selected) if self.app.number_of_rows() > 0 else None
+
+                if key == keys.T:
+                    self.app.setTreeMode(False)
+                    screen.remove_views(list(legendElements))
+                    legendElements = self.addLegend(screen, legends.main())
+
+                if key == keys.F:
+                    self.app.setTreeMode(False)
+                    self.isFiltering = True
+                    screen.remove_views(list(legendElements))
+                    legendElements = self.addLegend(screen, legends.filter())
+
+                if key == keys.UP:
+                    listView.select_previous()
+
+                if key == keys.DOWN:
+                    listView.select_next()
+
+                if node is not None:
+                    if key == keys.RIGHT:
+                        self.app.keyTree.expand(selected)
+
+                    if key == keys.LEFT and not self.app.keyTree.collapse(selected):
+                        parent = self.app.keyTree.parent(selected)
+                        for _ in range(selected - (parent if parent is not None else selected)):
+                            listView.select_previous()
+
+                    if key == keys.SPACE:
+                        self.app.toggleMarked(self.app.keyTrie().keys(node))
+
+                    if key == keys.ENTER:
+                        if len(self.app.markedKeys) > 0:
+                            self.editKeys(stdscr, sorted(self.app.markedKeys))
+                        elif node.isKey:
+                            self.editKeys(stdscr, [node.path])
+                        else:
+                            self.app.keyTree.toggle(selected)
+
+                    if self.isMacOs() and key == keys.K:
+                        subprocess.run("pbcopy", universal_newlines=True, input=node.path)
+
+                if key == keys.Q:
+                    exit(0)
+
             else:
+                if key == keys.T:
+                    self.app.setTreeMode(True)
+                    screen.remove_views(list(legendElements))
+                    legendElements = self.addLegend(screen, legends.tree())
+
                 if key == keys.F:
                     self.isFiltering = True
                     screen.remove_views(list(legendElements))
@@ -271,25 +438,22 @@ class UI(ListViewDelegate):
                 if key == keys.C:
                     self.app.clearFilter()
 
+                if key == keys.SPACE and self.app.number_of_rows() > 0:
+                    self.app.toggleMarked([self.selectedKey(listView)])
+
                 if key == keys.ENTER:
-                    if self.app.number_of_rows() == 0:
-                        self.app.createNewTranslationIfPossible()
+                    if len(self.app.markedKeys) > 0:
+                        self.editKeys(stdscr, sorted(self.app.markedKeys))
+                    elif self.app.number_of_rows() == 0:
+                        self.runEditor(stdscr, self.app.createNewTranslationIfPossible)
                     else:
-                        data = self.app.get_data(listView.get_selected_row_index())
-                        if isinstance(data, tuple):
-                            key, _, _ = data
-                            self.app.openKey(key)
-
-                        else:
-                            self.app.openKey(data)
-
-                    exit(0)
+                        self.editKeys(stdscr, [self.selectedKey(listView)])
 
                 if self.isMacOs() and key == keys.K:
                     if self.app.number_of_rows() > 0:
                         data = self.app.get_data(listView.get_selected_row_index())
-                        if isinstance(data, tuple):
-                            key, _, _ = data if isinstance(data, tuple) else data
+                        if isinstance(data, TranslationItem):
+                            key, _, _ = data if isinstance(data, TranslationItem) else data
 
                         else:
                             key = data
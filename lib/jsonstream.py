@@ -0,0 +1,116 @@
+import json
+import re
+from json.decoder import scanstring
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DELIMITERS = ' \t\n\r,}'
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonObjectStream:
+
+    def __init__(self, file, chunkSize=CHUNK_SIZE):
+        self.file = file
+        self.chunkSize = chunkSize
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.consumed = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+
+        chunk = self.file.read(self.chunkSize)
+        if len(chunk) == 0:
+            self.eof = True
+            return False
+
+        self.consumed += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def fail(self, message):
+        raise JsonStreamError('{} at character {}'.format(message, self.consumed + self.position))
+
+    def peek(self):
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.fail('Expected {}'.format(char.__repr__()))
+        self.position += 1
+
+    def readKey(self):
+        if self.peek() != '"':
+            self.fail('Expected property name enclosed in double quotes')
+
+        while True:
+            try:
+                key, end = scanstring(self.buffer, self.position + 1)
+                self.position = end
+                return key
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+
+    def readValue(self):
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                if (end < len(self.buffer) and self.buffer[end] in DELIMITERS) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+
+            if not self.fill():
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                self.position = end
+                return value
+
+    def __iter__(self):
+        self.expect('{')
+        if self.peek() == '}':
+            self.position += 1
+            return
+
+        while True:
+            key = self.readKey()
+            self.expect(':')
+            value = self.readValue()
+            yield (key, value)
+
+            char = self.peek()
+            if char not in (',', '}'):
+                self.fail('Expected \',\' or \'}\'')
+            self.position += 1
+            if char == '}':
+                if self.peek() != '':
+                    self.fail('Extra data')
+                return
+
+
+def iterJsonObject(path, prefix=None, chunkSize=CHUNK_SIZE):
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        for key, value in JsonObjectStream(file, chunkSize):
+            if prefix is None or key.startswith(prefix):
+                yield (key, value)
+
+
+def readJsonObject(path, prefix=None, chunkSize=CHUNK_SIZE):
+    return dict(iterJsonObject(path, prefix, chunkSize))
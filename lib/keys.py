@@ -12,4 +12,5 @@ ENTER=ord('\n')
 F=ord('f')
 Q=ord('q')
 C=ord('c')
-K=ord('k')
\ No newline at end of file
+K=ord('k')
+T=ord('t')
\ No newline at end of file
@@ -0,0 +1,102 @@
+import json
+import os
+import re
+from json.encoder import encode_basestring
+from lib import groupedjson
+from lib.localefiles import fileHasContent, readJsonFile, saveGroupedJsonFile, writeFileAtomically
+from lib.timings import countRead
+
+ESCAPED_UNICODE = '\\u'
+COLON = re.compile(r'[ \t\n\r]*:[ \t\n\r]*')
+NESTED_VALUE = re.compile(r'":[ \t\n\r]*[\[{]')
+DECODER = json.JSONDecoder()
+
+
+def isEscaped(content, index):
+    backslashes = 0
+    while index - backslashes > 0 and content[index - backslashes - 1] == '\\':
+        backslashes += 1
+    return backslashes % 2 == 1
+
+
+def findKeyValue(content, key):
+    encodedKey = encode_basestring(key)
+    end = len(content)
+
+    while True:
+        index = content.rfind(encodedKey, 0, end)
+        if index < 0:
+            return None
+
+        colon = COLON.match(content, index + len(encodedKey))
+        if colon is not None and not isEscaped(content, index):
+            value, valueEnd = DECODER.raw_decode(content, colon.end())
+            return (value, colon.end(), valueEnd)
+
+        end = index + len(encodedKey) - 1
+
+
+def isFlat(content):
+    return not any(not isEscaped(content, match.start()) for match in NESTED_VALUE.finditer(content))
+
+
+def readLocaleFile(path):
+    countRead(os.path.getsize(path))
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        return file.read()
+
+
+def readKeyEntries(path, keys):
+    content = readLocaleFile(path)
+    if not isFlat(content):
+        return readKeyEntriesStreaming(path, keys)
+
+    result = {}
+    for key in keys:
+        found = findKeyValue(content, key)
+        if found is not None:
+            result[key] = found[0]
+
+    if len(result) < len(keys) and ESCAPED_UNICODE in content:
+        return readKeyEntriesStreaming(path, keys)
+
+    return result
+
+
+def readKeyEntriesStreaming(path, keys):
+    streamed = readJsonFile(path, prefix=os.path.commonprefix(list(keys)))
+    return {key: streamed[key] for key in keys if key in streamed}
+
+
+def replaceValues(content, updates):
+    if not isFlat(content):
+        return None
+
+    spans = []
+    for key, value in updates.items():
+        found = findKeyValue(content, key)
+        if found is None or not isinstance(found[0], str) or not isinstance(value, str):
+            return None
+        spans.append((found[1], found[2], groupedjson.encodeValue(value)))
+
+    for begin, end, encoded in sorted(spans, reverse=True):
+        content = content[:begin] + encoded + content[end:]
+    return content
+
+
+def applyKeyChanges(path, updates, deletions, streaming=False):
+    if len(deletions) == 0:
+        content = replaceValues(readLocaleFile(path), updates)
+        if content is not None:
+            content = content.encode('utf-8')
+            if fileHasContent(path, content):
+                return False
+            writeFileAtomically(path, content)
+            return True
+
+    jsonObject = readJsonFile(path, streaming)
+    for key in deletions:
+        jsonObject.pop(key, None)
+    jsonObject.update(updates)
+
+    return saveGroupedJsonFile(path, jsonObject)
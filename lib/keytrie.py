@@ -0,0 +1,143 @@
+from bisect import bisect_left
+
+SEPARATOR = '.'
+ENCODED_SEPARATOR = '\0'
+SUBTREE_END = '\1'
+
+
+def encode(key):
+    return key.replace(SEPARATOR, ENCODED_SEPARATOR)
+
+
+class TrieNode:
+    __slots__ = ('path', 'depth', 'begin', 'end', 'isKey', 'expanded')
+
+    def __init__(self, path, depth, begin, end, isKey, expanded=False):
+        self.path = path
+        self.depth = depth
+        self.begin = begin
+        self.end = end
+        self.isKey = isKey
+        self.expanded = expanded
+
+    def name(self):
+        return self.path.rsplit(SEPARATOR, 1)[-1]
+
+    def count(self):
+        return self.end - self.begin
+
+    def hasChildren(self):
+        return self.count() > (1 if self.isKey else 0)
+
+    def withExpanded(self, expanded):
+        return TrieNode(self.path, self.depth, self.begin, self.end, self.isKey, expanded)
+
+    def __eq__(self, other):
+        return isinstance(other, TrieNode) and (self.path, self.expanded, self.end - self.begin) == (other.path, other.expanded, other.end - other.begin)
+
+    def __hash__(self):
+        return hash((self.path, self.expanded, self.end - self.begin))
+
+    def __repr__(self):
+        return 'TrieNode({}, {})'.format(self.path.__repr__(), self.count())
+
+
+class KeyTrie:
+
+    def __init__(self, keys):
+        self.encoded = sorted(map(encode, keys))
+
+    def root(self):
+        return TrieNode('', 0, 0, len(self.encoded), False, True)
+
+    def node(self, path):
+        encodedPath = encode(path)
+        begin = bisect_left(self.encoded, encodedPath)
+        end = bisect_left(self.encoded, encodedPath + SUBTREE_END, begin)
+        if begin == end:
+            return None
+
+        if self.encoded[begin] != encodedPath and not self.encoded[begin].startswith(encodedPath + ENCODED_SEPARATOR):
+            return None
+
+        return TrieNode(path, path.count(SEPARATOR) + 1, begin, end, self.encoded[begin] == encodedPath)
+
+    def count(self, path):
+        node = self.node(path)
+        return 0 if node is None else node.count()
+
+    def keys(self, node):
+        return [key.replace(ENCODED_SEPARATOR, SEPARATOR) for key in self.encoded[node.begin:node.end]]
+
+    def children(self, node):
+        prefix = encode(node.path) + ENCODED_SEPARATOR if node.depth > 0 else ''
+        result = []
+
+        index = node.begin + (1 if node.isKey else 0)
+        while index < node.end:
+            segment = self.encoded[index][len(prefix):].split(ENCODED_SEPARATOR, 1)[0]
+            encodedChild = prefix + segment
+            end = bisect_left(self.encoded, encodedChild + SUBTREE_END, index, node.end)
+            path = encodedChild.replace(ENCODED_SEPARATOR, SEPARATOR)
+            result.append(TrieNode(path, node.depth + 1, index, end, self.encoded[index] == encodedChild))
+            index = end
+
+        return result
+
+
+class KeyTree:
+
+    def __init__(self, trie, expandedPaths=frozenset()):
+        self.trie = trie
+        self.rows = trie.children(trie.root())
+
+        i = 0
+        while i < len(self.rows):
+            if self.rows[i].path in expandedPaths:
+                self.expand(i)
+            i += 1
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        return self.rows[i]
+
+    def expandedPaths(self):
+        return {node.path for node in self.rows if node.expanded}
+
+    def subtreeEnd(self, i):
+        depth = self.rows[i].depth
+        end = i + 1
+        while end < len(self.rows) and self.rows[end].depth > depth:
+            end += 1
+        return end
+
+    def expand(self, i):
+        node = self.rows[i]
+        if node.expanded or not node.hasChildren():
+            return False
+
+        self.rows[i] = node.withExpanded(True)
+        self.rows[i + 1:i + 1] = self.trie.children(node)
+        return True
+
+    def collapse(self, i):
+        node = self.rows[i]
+        if not node.expanded:
+            return False
+
+        del self.rows[i + 1:self.subtreeEnd(i)]
+        self.rows[i] = node.withExpanded(False)
+        return True
+
+    def toggle(self, i):
+        return self.collapse(i) or self.expand(i)
+
+    def parent(self, i):
+        depth = self.rows[i].depth
+        while i > 0:
+            i -= 1
+            if self.rows[i].depth < depth:
+                return i
+        return None
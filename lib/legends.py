@@ -2,11 +2,13 @@ import platform
 
 def main():
     result = [
-        ('[ENTER]', ' Edit Translation '),
+        ('[ENTER]', ' Edit Translation(s) '),
+        ('[SPACE]', ' Mark '),
         ('[UP]', ' Scroll up '),
         ('[DOWN]', ' Scroll down '),
         ('[F]', ' Filter '),
-        ('[C]', ' Clear Filter ')
+        ('[C]', ' Clear Filter '),
+        ('[T]', ' Tree ')
     ]
 
     if platform.system() == 'Darwin':
@@ -20,4 +22,21 @@ def filter():
         ('[ENTER]', ' Quit and save Filter '),
         ('[UP|DOWN]', ' Change Filter Criteria '),
         ('[ESC]', ' Quit and clear Filter ')
-    ]
\ No newline at end of file
+    ]
+
+def tree():
+    result = [
+        ('[ENTER]', ' Edit Translation(s) | Toggle Group '),
+        ('[SPACE]', ' Mark '),
+        ('[UP]', ' Scroll up '),
+        ('[DOWN]', ' Scroll down '),
+        ('[RIGHT]', ' Expand '),
+        ('[LEFT]', ' Collapse '),
+        ('[T]', ' List ')
+    ]
+
+    if platform.system() == 'Darwin':
+        result.append(('[K]', ' Copy Key '))
+
+    result.append(('[Q]', ' Quit '))
+    return result
\ No newline at end of file
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+from lib import groupedjson
+from lib.cache import contentHash, fileContentHash
+from lib.jsonstream import readJsonObject
+from lib.timings import countRead, countWritten
+
+def readJsonFile(path, streaming=False, prefix=None):
+    if streaming or prefix is not None:
+        countRead(os.path.getsize(path))
+        return readJsonObject(path, prefix)
+
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    countRead(len(content))
+    return json.loads(content)
+
+def readJsonFileIfChanged(path, knownDigest=None, streaming=False):
+    if streaming:
+        countRead(os.path.getsize(path))
+        digest = fileContentHash(path)
+        return (digest, None if digest == knownDigest else readJsonObject(path))
+
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    countRead(len(content))
+    digest = contentHash(content)
+    if digest == knownDigest:
+        return (digest, None)
+
+    return (digest, json.loads(content))
+
+def checkGroupedJsonFile(path):
+    with open(path, 'rb') as file:
+        raw = file.read()
+
+    countRead(len(raw))
+    content = raw.decode('utf-8')
+    jsonObject = json.loads(content)
+    if groupedjson.isGroupedJson(content, jsonObject):
+        return None
+
+    return groupedjson.differingGroups(content, jsonObject)
+
+def fileHasContent(path, content):
+    try:
+        if os.path.getsize(path) != len(content):
+            return False
+        countRead(len(content))
+        with open(path, 'rb') as file:
+            return file.read() == content
+    except FileNotFoundError:
+        return False
+
+def writeFileAtomically(path, content):
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, tmpPath = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+            file.flush()
+            countWritten(len(content))
+            os.fsync(file.fileno())
+
+        try:
+            os.chmod(tmpPath, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmpPath, 0o666 & ~currentUmask())
+
+        os.replace(tmpPath, path)
+    except BaseException:
+        try:
+            os.unlink(tmpPath)
+        except FileNotFoundError:
+            pass
+        raise
+
+def currentUmask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def saveGroupedJsonFile(path, jsonObject):
+    content = groupedjson.buildGroupedJson(jsonObject).encode('utf-8')
+    if fileHasContent(path, content):
+        return False
+
+    writeFileAtomically(path, content)
+    return True
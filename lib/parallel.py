@@ -0,0 +1,29 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+def defaultJobs():
+    return os.cpu_count() or 1
+
+def runPerLocale(function, arguments, jobs=1, processes=False):
+    results = {}
+    errors = {}
+
+    if jobs <= 1 or len(arguments) <= 1:
+        for locale, args in arguments.items():
+            try:
+                results[locale] = function(*args)
+            except Exception as e:
+                errors[locale] = e
+
+        return (results, errors)
+
+    Executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with Executor(max_workers=min(jobs, len(arguments))) as executor:
+        futures = {locale: executor.submit(function, *args) for locale, args in arguments.items()}
+        for locale, future in futures.items():
+            try:
+                results[locale] = future.result()
+            except Exception as e:
+                errors[locale] = e
+
+    return (results, errors)
@@ -0,0 +1,111 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, compress, islice, repeat
+from operator import add, ne
+
+SEPARATOR = '\0'
+SCAN_LIMIT_RATIO = 64
+CHUNK_SIZE = 65536
+
+
+class IndexedView:
+
+    def __init__(self, items, indices):
+        self.items = items
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        return self.items[self.indices[i]]
+
+    def __iter__(self):
+        return (self.items[i] for i in self.indices)
+
+
+class SearchIndex:
+
+    def __init__(self, items, texts=None):
+        self.items = items
+        texts = items if texts is None else texts
+
+        lengths = map(add, map(len, map(str.lower, texts)), repeat(len(SEPARATOR)))
+        self.starts = array('q', accumulate(lengths, initial=0))
+        self.haystack = SEPARATOR.join(map(str.lower, texts))
+
+        self.stack = [('', None)]
+
+    def scan(self, query):
+        haystack = self.haystack
+        starts = self.starts
+        limit = len(self.items) // SCAN_LIMIT_RATIO
+        result = array('q')
+
+        position = haystack.find(query)
+        while position != -1:
+            if len(result) > limit:
+                return None
+
+            index = bisect_right(starts, position) - 1
+            result.append(index)
+            position = haystack.find(query, starts[index + 1])
+
+        return result
+
+    def filter(self, query, candidates, begin, end):
+        if candidates is None:
+            end = min(end, len(self.items))
+            candidates = range(begin, end)
+            begins = islice(self.starts, begin, end)
+            ends = islice(self.starts, begin + 1, end + 1)
+        else:
+            candidates = candidates[begin:end]
+            begins = map(self.starts.__getitem__, candidates)
+            ends = map(self.starts.__getitem__, map(add, candidates, repeat(1)))
+
+        matches = map(ne, map(self.haystack.find, repeat(query), begins, ends), repeat(-1))
+        return compress(candidates, matches)
+
+    def view(self, indices):
+        if indices is None:
+            return self.items
+
+        return IndexedView(self.items, indices)
+
+    def search(self, query):
+        for result, _ in self.searchIncrementally(query):
+            pass
+
+        return result
+
+    def searchIncrementally(self, query, isCancelled=lambda: False, chunkSize=CHUNK_SIZE):
+        query = query.lower()
+
+        while not query.startswith(self.stack[-1][0]):
+            self.stack.pop()
+
+        previousQuery, candidates = self.stack[-1]
+        if previousQuery == query:
+            yield (self.view(candidates), True)
+            return
+
+        if candidates is None:
+            result = self.scan(query)
+            if result is not None:
+                self.stack.append((query, result))
+                yield (self.view(result), True)
+                return
+
+        total = len(self.items) if candidates is None else len(candidates)
+        result = array('q')
+        for begin in range(0, max(total, 1), chunkSize):
+            if isCancelled():
+                return
+
+            result.extend(self.filter(query, candidates, begin, begin + chunkSize))
+            if begin + chunkSize < total:
+                yield (self.view(result[:]), False)
+
+        self.stack.append((query, result))
+        yield (self.view(result), True)
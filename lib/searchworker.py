@@ -0,0 +1,59 @@
+import threading
+import time
+
+
+class SearchWorker:
+
+    def __init__(self, indexForCriteria):
+        self.indexForCriteria = indexForCriteria
+        self.condition = threading.Condition()
+        self.request = None
+        self.generation = 0
+        self.finishedGeneration = 0
+        self.published = None
+        self.latency = None
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, criteria, query):
+        with self.condition:
+            self.generation += 1
+            self.request = (self.generation, criteria, query, time.perf_counter())
+            self.condition.notify()
+
+    def isCancelled(self, generation):
+        return generation != self.generation
+
+    def isSearching(self):
+        with self.condition:
+            return self.finishedGeneration != self.generation
+
+    def publish(self, generation, criteria, result, done, submitted):
+        with self.condition:
+            if self.isCancelled(generation):
+                return
+
+            self.published = (criteria, result)
+            if done:
+                self.finishedGeneration = generation
+                self.latency = time.perf_counter() - submitted
+
+    def poll(self):
+        with self.condition:
+            published = self.published
+            self.published = None
+
+        return published
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.request is None:
+                    self.condition.wait()
+                generation, criteria, query, submitted = self.request
+                self.request = None
+
+            index = self.indexForCriteria(criteria)
+            for result, done in index.searchIncrementally(query, lambda: self.isCancelled(generation)):
+                self.publish(generation, criteria, result, done, submitted)
@@ -0,0 +1,221 @@
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from itertools import chain, compress, cycle, repeat
+from operator import eq, is_not
+
+MISSING = object()
+DELETED = object()
+
+
+class TranslationItem:
+    __slots__ = ('key', 'lang', 'value')
+
+    def __init__(self, key, lang, value):
+        self.key = key
+        self.lang = lang
+        self.value = value
+
+    def __iter__(self):
+        return iter((self.key, self.lang, self.value))
+
+    def __eq__(self, other):
+        return isinstance(other, TranslationItem) and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash((self.key, self.lang, self.value))
+
+    def __repr__(self):
+        return 'TranslationItem({}, {}, {})'.format(self.key.__repr__(), self.lang.__repr__(), self.value.__repr__())
+
+
+class TranslationItems:
+
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return len(self.store.values)
+
+    def __getitem__(self, row):
+        store = self.store
+        return TranslationItem(store.keys[store.rowKey[row]], store.locales[store.rowLocale[row]], store.values[row])
+
+    def __iter__(self):
+        return (self[row] for row in range(len(self)))
+
+
+class TranslationStore:
+
+    def __init__(self, locales, paths, keys, rowKey, rowLocale, values):
+        self.locales = locales
+        self.localeIds = {locale: i for i, locale in enumerate(locales)}
+        self.paths = paths
+        self.keys = keys
+        self.keyIds = dict(zip(keys, range(len(keys))))
+        self.rowKey = rowKey
+        self.rowLocale = rowLocale
+        self.values = values
+        self.offsets = array('I', map(bisect_left, repeat(rowKey), range(len(keys) + 1)))
+        self.changes = {}
+
+    @staticmethod
+    def fromLocaleObjects(translations):
+        locales = sorted(translations.keys())
+        paths = {locale: translations[locale][0] for locale in locales}
+        jsonObjects = [translations[locale][1] for locale in locales]
+
+        allKeys = set()
+        for jsonObject in jsonObjects:
+            allKeys.update(jsonObject.keys())
+        keys = sorted(map(sys.intern, allKeys))
+
+        columns = [list(map(jsonObject.get, keys, repeat(MISSING))) for jsonObject in jsonObjects]
+        cells = list(chain.from_iterable(zip(*columns)))
+        present = list(map(is_not, cells, repeat(MISSING)))
+
+        rowKey = array('I', compress(chain.from_iterable(map(repeat, range(len(keys)), repeat(len(locales)))), present))
+        rowLocale = array('H', compress(cycle(range(len(locales))), present))
+        values = list(compress(cells, present))
+
+        return TranslationStore(locales, paths, keys, rowKey, rowLocale, values)
+
+    def __getstate__(self):
+        return (self.locales, self.paths, self.keys, self.rowKey, self.rowLocale, self.values)
+
+    def __setstate__(self, state):
+        locales, paths, keys, rowKey, rowLocale, values = state
+        self.__init__(locales, paths, list(map(sys.intern, keys)), rowKey, rowLocale, values)
+
+    def baseEntry(self, key):
+        keyId = self.keyIds.get(key)
+        if keyId is None:
+            return {}
+
+        rows = range(self.offsets[keyId], self.offsets[keyId + 1])
+        return {self.locales[self.rowLocale[row]]: self.values[row] for row in rows}
+
+    def entry(self, key):
+        result = self.baseEntry(key)
+
+        for locale, value in self.changes.get(key, {}).items():
+            if value is DELETED:
+                result.pop(locale, None)
+            else:
+                result[locale] = value
+
+        return result
+
+    def contains(self, key):
+        if key in self.changes:
+            return len(self.entry(key)) > 0
+        return key in self.keyIds
+
+    def get(self, key, locale, default=None):
+        change = self.changes.get(key)
+        if change is not None and locale in change:
+            return default if change[locale] is DELETED else change[locale]
+
+        return self.baseEntry(key).get(locale, default)
+
+    def has(self, key, locale):
+        return self.get(key, locale, MISSING) is not MISSING
+
+    def set(self, key, locale, value):
+        self.changes.setdefault(sys.intern(key), {})[locale] = value
+
+    def delete(self, key, locale):
+        self.changes.setdefault(key, {})[locale] = DELETED
+
+    def localeObject(self, locale):
+        localeId = self.localeIds[locale]
+        selected = list(map(eq, self.rowLocale, repeat(localeId)))
+        result = dict(zip(map(self.keys.__getitem__, compress(self.rowKey, selected)), compress(self.values, selected)))
+
+        for key, change in self.changes.items():
+            if locale in change:
+                if change[locale] is DELETED:
+                    result.pop(key, None)
+                else:
+                    result[key] = change[locale]
+
+        return result
+
+    def localeChanges(self, locale):
+        updates = {}
+        deletions = []
+        for key, change in self.changes.items():
+            if locale in change:
+                if change[locale] is DELETED:
+                    deletions.append(key)
+                else:
+                    updates[key] = change[locale]
+
+        return (updates, deletions)
+
+    def compact(self):
+        if len(self.changes) == 0:
+            return
+
+        compacted = TranslationStore.fromLocaleObjects(self.translations())
+        self.__init__(compacted.locales, compacted.paths, compacted.keys, compacted.rowKey, compacted.rowLocale, compacted.values)
+
+    def withLocales(self, replaced, removed):
+        translations = {locale: (self.paths[locale], self.localeObject(locale)) for locale in self.locales if locale not in removed and locale not in replaced}
+        translations.update(replaced)
+        return TranslationStore.fromLocaleObjects(translations)
+
+    def items(self):
+        self.compact()
+        return TranslationItems(self)
+
+    def sortedKeys(self):
+        self.compact()
+        return self.keys
+
+    def dictionary(self):
+        return DictionaryView(self)
+
+    def translations(self):
+        return TranslationsView(self)
+
+
+class DictionaryView(Mapping):
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, key):
+        if not self.store.contains(key):
+            raise KeyError(key)
+        return self.store.entry(key)
+
+    def __contains__(self, key):
+        return self.store.contains(key)
+
+    def __iter__(self):
+        return iter(self.store.sortedKeys())
+
+    def __len__(self):
+        return len(self.store.sortedKeys())
+
+
+class TranslationsView(Mapping):
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, locale):
+        if locale not in self.store.localeIds:
+            raise KeyError(locale)
+        return (self.store.paths[locale], self.store.localeObject(locale))
+
+    def __iter__(self):
+        return iter(self.store.locales)
+
+    def __len__(self):
+        return len(self.store.locales)
+
+    def path(self, locale):
+        return self.store.paths[locale]
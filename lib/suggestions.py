@@ -0,0 +1,117 @@
+import heapq
+from array import array
+from lib.cache import StateCache
+
+SUGGESTIONS_CACHE_VERSION = 1
+NGRAM_SIZE = 3
+COMMON_NGRAM_RATIO = 0.05
+MIN_COMMON_NGRAM_COUNT = 64
+CANDIDATE_COUNT = 64
+MIN_SIMILARITY = 0.5
+COMPACT_RATIO = 0.25
+
+
+def normalizeText(text):
+    return ' '.join(text.split()).casefold()
+
+
+def ngrams(text):
+    padded = ' ' + normalizeText(text) + ' '
+    return {padded[i:i + NGRAM_SIZE] for i in range(max(len(padded) - NGRAM_SIZE + 1, 1))}
+
+
+def similarity(ngramsA, ngramsB):
+    if len(ngramsA) + len(ngramsB) == 0:
+        return 0
+    return 2 * len(ngramsA & ngramsB) / (len(ngramsA) + len(ngramsB))
+
+
+class SuggestionIndex:
+
+    def __init__(self):
+        self.keys = []
+        self.texts = []
+        self.docIds = {}
+        self.postings = {}
+        self.removed = 0
+
+    def add(self, key, text):
+        docId = len(self.keys)
+        self.keys.append(key)
+        self.texts.append(text)
+        self.docIds[key] = docId
+
+        for ngram in ngrams(text):
+            postings = self.postings.get(ngram)
+            if postings is None:
+                postings = self.postings[ngram] = array('I')
+            postings.append(docId)
+
+    def remove(self, key):
+        docId = self.docIds.pop(key)
+        self.texts[docId] = None
+        self.removed += 1
+
+    def sync(self, texts):
+        changed = False
+        for key in [key for key in self.docIds.keys() if key not in texts]:
+            self.remove(key)
+            changed = True
+
+        for key, text in texts.items():
+            docId = self.docIds.get(key)
+            if docId is not None and self.texts[docId] == text:
+                continue
+            if docId is not None:
+                self.remove(key)
+            self.add(key, text)
+            changed = True
+
+        if self.removed > len(self.keys) * COMPACT_RATIO:
+            self.compact()
+
+        return changed
+
+    def compact(self):
+        keys, texts = self.keys, self.texts
+        self.__init__()
+        for key, text in zip(keys, texts):
+            if text is not None:
+                self.add(key, text)
+
+    def search(self, text, count):
+        queryNgrams = ngrams(text)
+        commonLimit = max(MIN_COMMON_NGRAM_COUNT, int(len(self.keys) * COMMON_NGRAM_RATIO))
+
+        postingsByLength = sorted((self.postings[ngram] for ngram in queryNgrams if ngram in self.postings), key=len)
+        selected = [postings for postings in postingsByLength if len(postings) <= commonLimit]
+        if len(selected) == 0:
+            selected = postingsByLength[:1]
+
+        shared = {}
+        for postings in selected:
+            for docId in postings:
+                shared[docId] = shared.get(docId, 0) + 1
+
+        candidates = heapq.nlargest(CANDIDATE_COUNT, shared.keys(), key=shared.__getitem__)
+
+        result = []
+        for docId in candidates:
+            candidateText = self.texts[docId]
+            if candidateText is None:
+                continue
+            score = similarity(queryNgrams, ngrams(candidateText))
+            if score >= MIN_SIMILARITY:
+                result.append((score, self.keys[docId]))
+
+        return heapq.nlargest(count, result)
+
+
+class SuggestionCache(StateCache):
+
+    def __init__(self, translationsDirectory, cacheDirectory=None):
+        super().__init__(translationsDirectory, '.suggestions.pickle', SUGGESTIONS_CACHE_VERSION, cacheDirectory)
+
+    def load(self):
+        index = super().load()
+        return index if isinstance(index, SuggestionIndex) else SuggestionIndex()
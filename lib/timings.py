@@ -0,0 +1,151 @@
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+TIMINGS_VARIABLE = 'SG_TRANSLATIONS_TIMINGS'
+FORMATS = ['summary', 'json']
+
+counterLock = threading.Lock()
+counters = {'read': 0, 'written': 0}
+
+
+def countRead(numberOfBytes):
+    with counterLock:
+        counters['read'] += numberOfBytes
+
+
+def countWritten(numberOfBytes):
+    with counterLock:
+        counters['written'] += numberOfBytes
+
+
+def countedBytes():
+    with counterLock:
+        return (counters['read'], counters['written'])
+
+
+def peakMemory():
+    usage = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def formatBytes(numberOfBytes):
+    for unit in ['B', 'KiB', 'MiB']:
+        if numberOfBytes < 1024:
+            return '{:.0f} {}'.format(numberOfBytes, unit) if unit == 'B' else '{:.1f} {}'.format(numberOfBytes, unit)
+        numberOfBytes /= 1024
+    return '{:.1f} GiB'.format(numberOfBytes)
+
+
+def formatFromEnvironment():
+    value = os.getenv(TIMINGS_VARIABLE, '').strip().lower()
+    if value in FORMATS:
+        return value
+    if value in ['1', 'true', 'yes', 'on']:
+        return FORMATS[0]
+    return None
+
+
+class Timings:
+
+    def __init__(self, format=None, file=None):
+        self.format = format
+        self.file = file
+        self.phases = []
+        self.pending = None
+        self.pendingLock = threading.Lock()
+        self.wallBegin = time.perf_counter()
+        self.cpuBegin = time.process_time()
+
+    @property
+    def enabled(self):
+        return self.format is not None
+
+    def output(self):
+        return self.file if self.file is not None else sys.stderr
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        read, written = countedBytes()
+        wallBegin = time.perf_counter()
+        cpuBegin = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wallBegin
+            cpu = time.process_time() - cpuBegin
+            readAfter, writtenAfter = countedBytes()
+            self.record(name, wall, cpu, readAfter - read, writtenAfter - written)
+
+    def record(self, name, wall, cpu, read=0, written=0):
+        phase = {
+            'phase': name,
+            'wall': wall,
+            'cpu': cpu,
+            'read': read,
+            'written': written,
+            'peakMemory': peakMemory()
+        }
+        self.phases.append(phase)
+
+        if self.format == 'json':
+            with self.pendingLock:
+                if self.pending is not None:
+                    self.pending.append(phase)
+                    return
+            print(json.dumps(phase), file=self.output(), flush=True)
+
+    @contextmanager
+    def buffered(self):
+        self.pending = []
+        try:
+            yield
+        finally:
+            with self.pendingLock:
+                pending, self.pending = self.pending, None
+            for phase in pending:
+                print(json.dumps(phase), file=self.output(), flush=True)
+
+    def printSummary(self):
+        if self.format != 'summary' or len(self.phases) == 0:
+            return
+
+        file = self.output()
+        print('{:<24}{:>10}{:>10}{:>12}{:>12}{:>12}'.format('phase', 'wall', 'cpu', 'read', 'written', 'peak mem'), file=file)
+        for phase in self.phases:
+            print('{:<24}{:>9.3f}s{:>9.3f}s{:>12}{:>12}{:>12}'.format(
+                phase['phase'], phase['wall'], phase['cpu'],
+                formatBytes(phase['read']), formatBytes(phase['written']), formatBytes(phase['peakMemory'])), file=file)
+
+        print('{:<24}{:>9.3f}s{:>9.3f}s'.format('total', time.perf_counter() - self.wallBegin, time.process_time() - self.cpuBegin), file=file)
+
+
+class Profiler:
+
+    def __init__(self, path=None):
+        self.path = path
+        self.profile = None
+
+    def start(self):
+        if self.path is None:
+            return
+
+        import cProfile
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        if self.profile is None:
+            return
+
+        self.profile.disable()
+        self.profile.dump_stats(self.path)
+        self.profile = None
@@ -0,0 +1,363 @@
+import json
+import os
+import re
+import shutil
+import threading
+from subprocess import Popen, PIPE
+from lib.timings import countRead
+
+NODE_WORKER_SCRIPT = '''
+const readline = require('readline');
+const lines = readline.createInterface({ input: process.stdin });
+lines.on('line', (line) => {
+    let response;
+    try {
+        const getJson = new Function(JSON.parse(line));
+        response = { result: getJson() };
+    } catch (e) {
+        response = { error: String(e) };
+    }
+    process.stdout.write(JSON.stringify(response) + '\\n');
+});
+'''
+
+SINGLE_ESCAPES = {
+    'n': '\n',
+    't': '\t',
+    'r': '\r',
+    'b': '\b',
+    'f': '\f',
+    'v': '\v',
+    '0': '\0'
+}
+
+IDENTIFIER = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?')
+HEX = re.compile(r'[0-9A-Fa-f]+')
+
+
+class TsSyntaxError(Exception):
+
+    def __init__(self, message, position):
+        super().__init__('{} at position {}'.format(message, position))
+        self.position = position
+
+
+def findNthOccurrence(string, substring, n):
+    parts= string.split(substring, n)
+    if len(parts)<=n:
+        return -1
+    return len(string)-len(parts[-1])-len(substring)
+
+
+def findNthOccurrenceFromBehind(string, substring, n):
+    end = len(string)
+
+    while n > 0:
+        index = string.rfind(substring, 0, end)
+        n = n-1
+        end = index
+        if index == -1:
+            break
+
+    return index
+
+
+def extractFunctionBody(content, blockLevel):
+    begin = findNthOccurrence(content, '{', blockLevel)
+    end = findNthOccurrenceFromBehind(content, '}', blockLevel) + 1
+    return content[begin:end]
+
+
+class ObjectLiteralParser:
+
+    def __init__(self, source):
+        self.source = source
+        self.position = 0
+
+    def fail(self, message):
+        raise TsSyntaxError(message, self.position)
+
+    def skipWhitespaceAndComments(self):
+        source = self.source
+        while self.position < len(source):
+            char = source[self.position]
+            if char.isspace():
+                self.position += 1
+            elif source.startswith('//', self.position):
+                end = source.find('\n', self.position)
+                self.position = len(source) if end == -1 else end + 1
+            elif source.startswith('/*', self.position):
+                end = source.find('*/', self.position + 2)
+                if end == -1:
+                    self.fail('Unterminated comment')
+                self.position = end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skipWhitespaceAndComments()
+        return self.source[self.position] if self.position < len(self.source) else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.fail('Expected {}'.format(char.__repr__()))
+        self.position += 1
+
+    def parseFunctionBody(self):
+        self.expect('{')
+        self.skipWhitespaceAndComments()
+        match = IDENTIFIER.match(self.source, self.position)
+        if match is None or match.group(0) != 'return':
+            self.fail('Expected return statement')
+        self.position = match.end()
+
+        result = self.parseValue()
+
+        if self.peek() == ';':
+            self.position += 1
+        self.expect('}')
+        if self.peek() != '':
+            self.fail('Unexpected content after function body')
+
+        return result
+
+    def parseValue(self):
+        value = self.parseTerm()
+
+        while self.peek() == '+':
+            self.position += 1
+            right = self.parseTerm()
+            if not isinstance(value, str) or not isinstance(right, str):
+                self.fail('Only string concatenation is supported')
+            value = value + right
+
+        return value
+
+    def parseTerm(self):
+        char = self.peek()
+
+        if char in ('\'', '"'):
+            return self.parseString(char)
+        if char == '`':
+            return self.parseTemplate()
+        if char == '{':
+            return self.parseObject()
+        if char == '[':
+            return self.parseArray()
+        if char == '(':
+            self.position += 1
+            value = self.parseValue()
+            self.expect(')')
+            return value
+
+        match = NUMBER.match(self.source, self.position)
+        if match is not None:
+            self.position = match.end()
+            return json.loads(match.group(0))
+
+        match = IDENTIFIER.match(self.source, self.position)
+        if match is not None:
+            constants = {'true': True, 'false': False, 'null': None}
+            if match.group(0) in constants:
+                self.position = match.end()
+                return constants[match.group(0)]
+
+        self.fail('Unsupported expression')
+
+    def parseKey(self):
+        char = self.peek()
+
+        if char in ('\'', '"'):
+            return self.parseString(char)
+
+        match = IDENTIFIER.match(self.source, self.position) or NUMBER.match(self.source, self.position)
+        if match is None:
+            self.fail('Expected property name')
+        self.position = match.end()
+        return match.group(0)
+
+    def parseObject(self):
+        self.expect('{')
+        result = {}
+
+        while self.peek() != '}':
+            key = self.parseKey()
+            self.expect(':')
+            result[key] = self.parseValue()
+
+            if self.peek() == ',':
+                self.position += 1
+            elif self.peek() != '}':
+                self.fail('Expected \',\' or \'}\'')
+
+        self.position += 1
+        return result
+
+    def parseArray(self):
+        self.expect('[')
+        result = []
+
+        while self.peek() != ']':
+            result.append(self.parseValue())
+
+            if self.peek() == ',':
+                self.position += 1
+            elif self.peek() != ']':
+                self.fail('Expected \',\' or \']\'')
+
+        self.position += 1
+        return result
+
+    def parseEscape(self):
+        source = self.source
+        char = source[self.position] if self.position < len(source) else ''
+        self.position += 1
+
+        if char in SINGLE_ESCAPES:
+            if char == '0' and self.position < len(source) and source[self.position].isdigit():
+                self.fail('Octal escapes are not supported')
+            return SINGLE_ESCAPES[char]
+
+        if char == 'x':
+            digits = source[self.position:self.position + 2]
+            if len(digits) != 2 or HEX.fullmatch(digits) is None:
+                self.fail('Invalid hexadecimal escape')
+            self.position += 2
+            return chr(int(digits, 16))
+
+        if char == 'u':
+            if source.startswith('{', self.position):
+                end = source.find('}', self.position)
+                digits = source[self.position + 1:end] if end != -1 else ''
+                if HEX.fullmatch(digits) is None:
+                    self.fail('Invalid unicode escape')
+                self.position = end + 1
+                return chr(int(digits, 16))
+
+            digits = source[self.position:self.position + 4]
+            if len(digits) != 4 or HEX.fullmatch(digits) is None:
+                self.fail('Invalid unicode escape')
+            self.position += 4
+            codePoint = int(digits, 16)
+
+            if 0xD800 <= codePoint <= 0xDBFF and source.startswith('\\u', self.position):
+                low = source[self.position + 2:self.position + 6]
+                if HEX.fullmatch(low) is not None and 0xDC00 <= int(low, 16) <= 0xDFFF:
+                    self.position += 6
+                    return chr(0x10000 + ((codePoint - 0xD800) << 10) + (int(low, 16) - 0xDC00))
+
+            return chr(codePoint)
+
+        if char == '\r':
+            if source.startswith('\n', self.position):
+                self.position += 1
+            return ''
+
+        if char in ('\n', '\u2028', '\u2029'):
+            return ''
+
+        if char == '' or char.isdigit():
+            self.fail('Invalid escape sequence')
+
+        return char
+
+    def parseString(self, quote):
+        self.expect(quote)
+        source = self.source
+        parts = []
+
+        while True:
+            if self.position >= len(source):
+                self.fail('Unterminated string')
+
+            char = source[self.position]
+            if char == quote:
+                self.position += 1
+                return ''.join(parts)
+            if char in ('\n', '\r'):
+                self.fail('Unterminated string')
+
+            self.position += 1
+            if char == '\\':
+                parts.append(self.parseEscape())
+            else:
+                parts.append(char)
+
+    def parseTemplate(self):
+        self.expect('`')
+        source = self.source
+        parts = []
+
+        while True:
+            if self.position >= len(source):
+                self.fail('Unterminated template literal')
+
+            char = source[self.position]
+            if char == '`':
+                self.position += 1
+                return ''.join(parts)
+            if source.startswith('${', self.position):
+                self.fail('Template substitutions are not supported')
+
+            self.position += 1
+            if char == '\\':
+                parts.append(self.parseEscape())
+            elif char == '\r':
+                if source.startswith('\n', self.position):
+                    self.position += 1
+                parts.append('\n')
+            else:
+                parts.append(char)
+
+
+def parseFunctionBody(functionContent):
+    return ObjectLiteralParser(functionContent).parseFunctionBody()
+
+
+def readTypeScriptTranslations(path, blockLevel):
+    countRead(os.path.getsize(path))
+    with open(path, 'r', encoding='utf-8') as file:
+        content = file.read()
+
+    functionContent = extractFunctionBody(content, blockLevel)
+    try:
+        return (functionContent, parseFunctionBody(functionContent))
+    except TsSyntaxError:
+        return (functionContent, None)
+
+
+class NodeWorker:
+
+    def __init__(self):
+        self.process = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def isAvailable():
+        return shutil.which('node') is not None
+
+    def evaluate(self, functionContent):
+        with self.lock:
+            if self.process is None:
+                self.process = Popen(['node', '-e', NODE_WORKER_SCRIPT], stdin=PIPE, stdout=PIPE, encoding='utf-8')
+
+            self.process.stdin.write(json.dumps(functionContent) + '\n')
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+
+        if line == '':
+            raise RuntimeError('node worker terminated unexpectedly')
+
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+
+        return response['result']
+
+    def close(self):
+        with self.lock:
+            if self.process is not None:
+                self.process.stdin.close()
+                self.process.wait()
+                self.process = None
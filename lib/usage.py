@@ -0,0 +1,95 @@
+import os
+import re
+from bisect import bisect_left
+from pathlib import Path
+from lib.cache import StateCache
+from lib.timings import countRead
+
+USAGE_CACHE_VERSION = 2
+SOURCE_PATTERNS = ['*.ts', '*.html']
+EXCLUDED_DIRECTORIES = {'node_modules', '.git', 'dist', '.angular'}
+
+TOKEN = re.compile(r'[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*')
+DYNAMIC_PREFIX = re.compile(r'''['"`]([A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*\.)(?:['"`]|\$\{)''')
+KEY_LITERAL = r'''([A-Za-z0-9_.-]*[A-Za-z0-9_-])\1(?!\s*\+)'''
+TRANSLATE_USAGES = [
+    re.compile(r'''(['"`])''' + KEY_LITERAL + r'''\s*\|\s*translate\b'''),
+    re.compile(r'''\b[tT]ranslat\w*\.(?:instant|get|stream)\(\s*(['"`])''' + KEY_LITERAL),
+    re.compile(r'''\b(?:marker|_)\(\s*(['"`])''' + KEY_LITERAL),
+    re.compile(r'''\btranslate\s*=\s*(['"])''' + KEY_LITERAL)
+]
+
+
+def findSourceFiles(root, excludedDirectory=None):
+    excluded = os.path.abspath(excludedDirectory) if excludedDirectory is not None else None
+    result = []
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if d not in EXCLUDED_DIRECTORIES and os.path.abspath(os.path.join(directory, d)) != excluded)
+        for filename in sorted(filenames):
+            if any(Path(filename).match(pattern) for pattern in SOURCE_PATTERNS):
+                result.append(os.path.join(directory, filename))
+    return result
+
+
+def scanSource(content):
+    tokens = frozenset(TOKEN.findall(content))
+    prefixes = frozenset(DYNAMIC_PREFIX.findall(content))
+    used = frozenset(match.group(2) for pattern in TRANSLATE_USAGES for match in pattern.finditer(content))
+    return (tokens, prefixes, used)
+
+
+def scanSourceFiles(paths):
+    result = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            content = file.read()
+        countRead(len(content))
+        result[path] = scanSource(content)
+    return result
+
+
+def fileSignature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class UsageCache(StateCache):
+
+    def __init__(self, sourceDirectory, cacheDirectory=None):
+        super().__init__(sourceDirectory, '.usage.pickle', USAGE_CACHE_VERSION, cacheDirectory)
+
+
+class UsageReport:
+
+    def __init__(self, sortedKeys, entry, allLanguages, scans):
+        self.allLanguages = allLanguages
+
+        tokens = set()
+        prefixes = set()
+        self.usedBy = {}
+        for path, (fileTokens, filePrefixes, fileUsed) in scans.items():
+            tokens.update(fileTokens)
+            prefixes.update(filePrefixes)
+            for key in fileUsed:
+                self.usedBy.setdefault(key, []).append(path)
+
+        keys = set(sortedKeys)
+        referenced = tokens & keys
+        referenced.update(key for prefix in prefixes for key in keysWithPrefix(sortedKeys, prefix))
+
+        self.unused = [key for key in sortedKeys if key not in referenced]
+        self.missing = sorted(key for key in self.usedBy.keys() if key not in keys)
+
+        self.incomplete = {lang: [] for lang in allLanguages}
+        for key in sorted(referenced):
+            translated = entry(key)
+            for lang in allLanguages:
+                if lang not in translated:
+                    self.incomplete[lang].append(key)
+
+
+def keysWithPrefix(sortedKeys, prefix):
+    index = bisect_left(sortedKeys, prefix)
+    while index < len(sortedKeys) and sortedKeys[index].startswith(prefix):
+        yield sortedKeys[index]
+        index += 1
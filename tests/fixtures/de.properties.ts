@@ -0,0 +1,20 @@
+export class DeProperties {
+    getProperties() {
+        return {
+            // Comments are skipped
+            'common.cancel': 'Abbrechen',
+            "common.quote": "Sag \"Hallo\" und 'tschüss'",
+            common_escapes: 'Zeile\neins\ttab \x41 ä \u{1F600} 😀',
+            'common.long': 'Erster Teil, ' +
+                "zweiter Teil, " +
+                `dritter Teil`,
+            /* block
+               comment */
+            'common.continued': 'eins \
+zwei',
+            'common.template': `Zeile 1
+Zeile 2`,
+            'common.nested': { inner: ['a', 1, true, null] },
+        };
+    }
+}
@@ -0,0 +1,74 @@
+import io
+import json
+import os
+import unittest
+from lib.jsonstream import JsonObjectStream, JsonStreamError, readJsonObject
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+CHUNK_SIZES = [1, 2, 3, 5, 7, 64, 1 << 20]
+
+CONTENT = '''{
+    "a.b": "escaped \\" quote \\\\ and \\u00e4 \\ud83d\\ude00",
+    "a.c" : 12345,
+    "a.d":-1.5e3,
+    "a.e": true,
+    "a.f": null,
+    "a.g": {"nested": [1, "x", {"y": false}]},
+    "b.a": ""
+}'''
+
+
+def streamed(content, chunkSize):
+    return list(JsonObjectStream(io.StringIO(content), chunkSize))
+
+
+class JsonObjectStreamTest(unittest.TestCase):
+
+    def testChunkBoundaries(self):
+        expected = list(json.loads(CONTENT).items())
+        for chunkSize in CHUNK_SIZES:
+            with self.subTest(chunkSize=chunkSize):
+                self.assertEqual(streamed(CONTENT, chunkSize), expected)
+
+    def testNumberAtEndOfInput(self):
+        for chunkSize in CHUNK_SIZES:
+            with self.subTest(chunkSize=chunkSize):
+                self.assertEqual(streamed('{"a": 1234}', chunkSize), [('a', 1234)])
+                self.assertEqual(streamed('{"a":1234 }', chunkSize), [('a', 1234)])
+
+    def testEmptyObject(self):
+        for chunkSize in CHUNK_SIZES:
+            with self.subTest(chunkSize=chunkSize):
+                self.assertEqual(streamed(' { } ', chunkSize), [])
+
+    def testInvalidContent(self):
+        for content in ['{"a": 1} x', '{"a": 1 "b": 2}', '["a"]', '{"a": }', '{"a": "x']:
+            for chunkSize in [1, 4, 1 << 20]:
+                with self.subTest(content=content, chunkSize=chunkSize):
+                    with self.assertRaises(ValueError):
+                        streamed(content, chunkSize)
+
+    def testErrorPositionCountsConsumedInput(self):
+        with self.assertRaises(JsonStreamError) as context:
+            streamed('{"abc": 1, "def": 2 x}', 3)
+        self.assertIn('at character 20', str(context.exception))
+
+
+class ReadJsonObjectTest(unittest.TestCase):
+
+    def testReadsFixture(self):
+        path = os.path.join(FIXTURES, 'de.json')
+        with open(path, encoding='utf-8') as file:
+            expected = json.load(file)
+
+        for chunkSize in CHUNK_SIZES:
+            with self.subTest(chunkSize=chunkSize):
+                self.assertEqual(readJsonObject(path, chunkSize=chunkSize), expected)
+
+    def testPrefix(self):
+        path = os.path.join(FIXTURES, 'de.json')
+        self.assertEqual(readJsonObject(path, prefix='common.unicode', chunkSize=4), {'common.unicodeä': 'Umlaut'})
+
+
+if __name__ == '__main__':
+    unittest.main()
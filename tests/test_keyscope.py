@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from lib.keyscope import applyKeyChanges, findKeyValue, readKeyEntries, replaceValues
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+ESCAPED_CONTENT = '''{
+    "b.key": "this",
+    "c.\\u00e4": "escaped key",
+    "d.key": "backslash \\\\",
+    "z.key": "contains \\"b.key\\": \\"not this\\""
+}'''
+
+
+class KeyScopeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def locale(self, content, name='de.json'):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as file:
+            return file.read()
+
+    def testFindKeyValueSkipsEscapedQuotes(self):
+        value, begin, end = findKeyValue(ESCAPED_CONTENT, 'b.key')
+        self.assertEqual(value, 'this')
+        self.assertEqual(ESCAPED_CONTENT[begin:end], '"this"')
+        self.assertEqual(findKeyValue(ESCAPED_CONTENT, 'd.key')[0], 'backslash \\')
+        self.assertIsNone(findKeyValue(ESCAPED_CONTENT, 'missing'))
+
+    def testFindKeyValueWithQuoteInKey(self):
+        with open(os.path.join(FIXTURES, 'de.json'), encoding='utf-8') as file:
+            content = file.read()
+
+        self.assertEqual(findKeyValue(content, 'common.escaped"key')[0], 'Wert')
+        self.assertEqual(findKeyValue(content, 'common.quote')[0], 'Sag "Hallo" \\" und ä')
+
+    def testReadKeyEntries(self):
+        path = self.locale(ESCAPED_CONTENT)
+        self.assertEqual(readKeyEntries(path, ['b.key', 'c.ä', 'missing']), {'b.key': 'this', 'c.ä': 'escaped key'})
+        self.assertEqual(readKeyEntries(os.path.join(FIXTURES, 'de.json'), ['common.unicodeä', 'common.tail']), {'common.unicodeä': 'Umlaut', 'common.tail': 'Ende'})
+
+    def testReplaceValuesKeepsOtherBytes(self):
+        replaced = replaceValues(ESCAPED_CONTENT, {'b.key': 'new "value"\n', 'd.key': 'ä'})
+
+        self.assertEqual(json.loads(replaced), dict(json.loads(ESCAPED_CONTENT), **{'b.key': 'new "value"\n', 'd.key': 'ä'}))
+        self.assertEqual(replaced.replace('"new \\"value\\"\\n"', '"this"').replace('"ä"', '"backslash \\\\"'), ESCAPED_CONTENT)
+
+    def testReplaceValuesFallsBack(self):
+        self.assertIsNone(replaceValues(ESCAPED_CONTENT, {'missing': 'x'}))
+        self.assertIsNone(replaceValues(ESCAPED_CONTENT, {'b.key': None}))
+        self.assertIsNone(replaceValues('{"a": {"b": "c"}}', {'a': 'x'}))
+
+    def testApplyKeyChangesSplicesUpdates(self):
+        path = self.locale(ESCAPED_CONTENT)
+
+        self.assertTrue(applyKeyChanges(path, {'b.key': 'changed'}, []))
+        self.assertEqual(self.read(path), ESCAPED_CONTENT.replace('"this"', '"changed"'))
+        self.assertFalse(applyKeyChanges(path, {'b.key': 'changed'}, []))
+
+    def testApplyKeyChangesRewritesOnDeletion(self):
+        path = self.locale(ESCAPED_CONTENT)
+
+        self.assertTrue(applyKeyChanges(path, {'e.key': 'added'}, ['z.key']))
+        expected = dict(json.loads(ESCAPED_CONTENT), **{'e.key': 'added'})
+        del expected['z.key']
+        self.assertEqual(json.loads(self.read(path)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
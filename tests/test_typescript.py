@@ -0,0 +1,61 @@
+import os
+import unittest
+from lib.typescript import TsSyntaxError, extractFunctionBody, parseFunctionBody, readTypeScriptTranslations
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def parseReturn(literal):
+    return parseFunctionBody('{ return ' + literal + '; }')
+
+
+class ReadTypeScriptTranslationsTest(unittest.TestCase):
+
+    def testParsesFixture(self):
+        _, parsed = readTypeScriptTranslations(os.path.join(FIXTURES, 'de.properties.ts'), 2)
+
+        self.assertEqual(parsed, {
+            'common.cancel': 'Abbrechen',
+            'common.quote': 'Sag "Hallo" und \'tschüss\'',
+            'common_escapes': 'Zeile\neins\ttab A ä 😀 😀',
+            'common.long': 'Erster Teil, zweiter Teil, dritter Teil',
+            'common.continued': 'eins zwei',
+            'common.template': 'Zeile 1\nZeile 2',
+            'common.nested': {'inner': ['a', 1, True, None]}
+        })
+
+    def testExtractsFunctionBody(self):
+        content = 'export class A {\n    get() {\n        return { a: \'{}\' };\n    }\n}\n'
+        self.assertEqual(extractFunctionBody(content, 2), '{\n        return { a: \'{}\' };\n    }')
+
+    def testUnsupportedSyntaxIsNotParsed(self):
+        path = os.path.join(FIXTURES, 'de.properties.ts')
+        with open(path, encoding='utf-8') as file:
+            content = file.read()
+
+        functionContent = extractFunctionBody(content.replace('`dritter Teil`', '`${part}`'), 2)
+        with self.assertRaises(TsSyntaxError):
+            parseFunctionBody(functionContent)
+
+
+class ObjectLiteralParserTest(unittest.TestCase):
+
+    def testEscapes(self):
+        self.assertEqual(parseReturn(r"{ a: 'it\'s', b: " + r'"\"q\"", c: ' + r"'\\n', d: '\0' }"), {'a': 'it\'s', 'b': '"q"', 'c': '\\n', 'd': '\0'})
+        self.assertEqual(parseReturn(r"{ a: '😀', b: 'ä\x41', c: '\u{1F600}' }"), {'a': '😀', 'b': 'äA', 'c': '😀'})
+
+    def testConcatenation(self):
+        self.assertEqual(parseReturn("{ a: 'x' + \"y\" + `z`, b: ('1' + '2') + '3' }"), {'a': 'xyz', 'b': '123'})
+
+    def testTrailingCommasAndComments(self):
+        self.assertEqual(parseReturn("{ // first\n a: 'x', /* b: 'y', */ c: ['z',], }"), {'a': 'x', 'c': ['z']})
+
+    def testRejectsUnsupportedSyntax(self):
+        for literal in ["{ a: 'x' + 1 }", "{ a: b }", "{ a: `${b}` }", "{ a: '\\01' }", "{ a: 'x }", "{ a: 'x\ny' }", "{ a: 'x' b: 'y' }"]:
+            with self.subTest(literal=literal):
+                with self.assertRaises(TsSyntaxError):
+                    parseReturn(literal)
+
+
+if __name__ == '__main__':
+    unittest.main()